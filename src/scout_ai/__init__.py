@@ -103,6 +103,7 @@ def __getattr__(name: str) -> Any:
             MedicalSectionType as _MST,
         )
 
-        _map = {"MedicalSectionType": _MST, "ExtractionCategory": _EC}
-        return _map[name]
+        # Cache in module globals so later lookups skip __getattr__ entirely
+        globals().update(MedicalSectionType=_MST, ExtractionCategory=_EC)
+        return globals()[name]
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -35,7 +35,14 @@ def create_extraction_agent(settings: AppSettings, **kwargs: Any) -> Agent:
         model=model,
         system_prompt=EXTRACTION_SYSTEM_PROMPT,
         tools=[extract_batch, extract_individual],
-        hooks=[AuditHook(), CostHook()],
+        hooks=[
+            AuditHook(
+                batch_size=settings.observability.audit_batch_size,
+                flush_interval_seconds=settings.observability.audit_flush_interval_seconds,
+                enabled=settings.observability.enable_audit,
+            ),
+            CostHook(),
+        ],
         trace_attributes={"agent.type": "extraction"},
         name="Scout Extraction Agent",
         description="Extracts precise answers from medical document context with citations",
@@ -51,7 +51,14 @@ def create_indexing_agent(settings: AppSettings, **kwargs: Any) -> Agent:
             split_large_nodes,
             enrich_nodes,
         ],
-        hooks=[AuditHook(), CostHook()],
+        hooks=[
+            AuditHook(
+                batch_size=settings.observability.audit_batch_size,
+                flush_interval_seconds=settings.observability.audit_flush_interval_seconds,
+                enabled=settings.observability.enable_audit,
+            ),
+            CostHook(),
+        ],
         trace_attributes={"agent.type": "indexing"},
         name="Scout Indexing Agent",
         description="Builds hierarchical tree indexes from pre-OCR'd document pages",
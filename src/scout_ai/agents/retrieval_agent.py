@@ -35,7 +35,14 @@ def create_retrieval_agent(settings: AppSettings, **kwargs: Any) -> Agent:
         model=model,
         system_prompt=RETRIEVAL_SYSTEM_PROMPT,
         tools=[tree_search, batch_retrieve],
-        hooks=[AuditHook(), CostHook()],
+        hooks=[
+            AuditHook(
+                batch_size=settings.observability.audit_batch_size,
+                flush_interval_seconds=settings.observability.audit_flush_interval_seconds,
+                enabled=settings.observability.enable_audit,
+            ),
+            CostHook(),
+        ],
         trace_attributes={"agent.type": "retrieval"},
         name="Scout Retrieval Agent",
         description="Searches document tree indexes for relevant sections",
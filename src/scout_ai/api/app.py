@@ -34,6 +34,14 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     )
 
     app.state.settings = settings
+    app.state.synthesis_response_cache = None
+    if settings.caching.response_cache_enabled:
+        from scout_ai.domains.aps.synthesis.pipeline import SynthesisResponseCache
+
+        app.state.synthesis_response_cache = SynthesisResponseCache(
+            ttl_seconds=settings.caching.response_cache_ttl_seconds,
+            max_size=settings.caching.response_cache_max_size,
+        )
     yield
 
 
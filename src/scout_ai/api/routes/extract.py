@@ -167,7 +167,11 @@ async def extract(request: ExtractRequest, req: Request) -> ExtractResponse:
         )
         client = LLMClient(legacy_settings)
         cache_enabled = settings.caching.enabled
-        synth = SynthesisPipeline(client, cache_enabled=cache_enabled)
+        synth = SynthesisPipeline(
+            client,
+            cache_enabled=cache_enabled,
+            response_cache=getattr(req.app.state, "synthesis_response_cache", None),
+        )
         metadata = {"doc_id": request.doc_id}
 
         # Create rules engine for post-LLM validation
@@ -5,6 +5,10 @@ prompt registry via PEP 562 ``__getattr__``, enabling DynamoDB-backed versioned
 prompts while maintaining full backward compatibility::
 
     from scout_ai.aps.prompts import TOC_DETECT_PROMPT  # still works
+
+``SYNTHESIS_PROMPT`` and ``SYNTHESIS_STRUCTURED_PROMPT`` were split into
+static-prefix / dynamic-suffix pairs; the old names still resolve to the
+assembled template (see ``scout_ai.prompts.templates.aps.synthesis``).
 """
 
 from __future__ import annotations
@@ -29,13 +33,23 @@ _PROMPT_MAP: dict[str, tuple[str, str]] = {
     "CLASSIFY_SECTION_PROMPT": ("aps", "classification"),
     # Synthesis
     "SYNTHESIS_SYSTEM_PROMPT": ("aps", "synthesis"),
-    "SYNTHESIS_PROMPT": ("aps", "synthesis"),
+    "SYNTHESIS_STATIC_PREFIX": ("aps", "synthesis"),
+    "SYNTHESIS_DYNAMIC_SUFFIX": ("aps", "synthesis"),
+    "SYNTHESIS_STRUCTURED_STATIC_PREFIX": ("aps", "synthesis"),
+    "SYNTHESIS_STRUCTURED_DYNAMIC_SUFFIX": ("aps", "synthesis"),
 }
 
-_PROMPT_NAMES = frozenset(_PROMPT_MAP.keys())
+# Pre-split synthesis names, assembled from their static + dynamic parts
+_LEGACY_NAMES = frozenset({"SYNTHESIS_PROMPT", "SYNTHESIS_STRUCTURED_PROMPT"})
+
+_PROMPT_NAMES = frozenset(_PROMPT_MAP.keys()) | _LEGACY_NAMES
 
 
 def __getattr__(name: str) -> str:
+    if name in _LEGACY_NAMES:
+        from scout_ai.prompts.templates.aps.synthesis import assemble_legacy_prompt
+
+        return assemble_legacy_prompt(name)
     if name in _PROMPT_MAP:
         from scout_ai.prompts.registry import get_prompt
 
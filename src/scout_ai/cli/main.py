@@ -9,11 +9,13 @@ from pathlib import Path
 from typing import Optional
 
 import typer
+from pydantic import TypeAdapter
 from rich.console import Console
 from rich.table import Table
 
 from scout_ai.config import ScoutSettings
 from scout_ai.models import (
+    BatchExtractionResult,
     DocumentIndex,
     ExtractionQuestion,
     PageContent,
@@ -30,6 +32,8 @@ from scout_ai.services.ingestion_service import IngestionService
 app = typer.Typer(name="scout-ai", help="Vectorless RAG with tree-indexed retrieval")
 console = Console()
 
+_BATCH_RESULTS_ADAPTER = TypeAdapter(list[BatchExtractionResult])
+
 
 def _build_settings(
     base_url: Optional[str],
@@ -123,9 +127,7 @@ def retrieve(
     retrieval_impl = ScoutRetrieval(settings, client)
 
     console.print(f"[bold]Loading index from {index_file}[/bold]")
-    doc_index = DocumentIndex.model_validate_json(
-        index_file.read_text(encoding="utf-8")
-    )
+    doc_index = DocumentIndex.model_validate_json(index_file.read_bytes())
 
     async def _run():
         return await retrieval_impl.retrieve(doc_index, query, top_k=top_k)
@@ -177,9 +179,7 @@ def extract(
     service = ExtractionService(retrieval_impl, chat_impl)
 
     console.print(f"[bold]Loading index from {index_file}[/bold]")
-    doc_index = DocumentIndex.model_validate_json(
-        index_file.read_text(encoding="utf-8")
-    )
+    doc_index = DocumentIndex.model_validate_json(index_file.read_bytes())
 
     console.print(f"[bold]Loading questions from {questions_file}[/bold]")
     raw_questions = json.loads(questions_file.read_text(encoding="utf-8"))
@@ -191,15 +191,14 @@ def extract(
 
     results = asyncio.run(_run())
 
-    output_data = [r.model_dump() for r in results]
+    # Serialized in one pass by pydantic-core, no intermediate dicts
+    output_json = _BATCH_RESULTS_ADAPTER.dump_json(results, indent=2).decode("utf-8")
 
     if output:
-        output.write_text(
-            json.dumps(output_data, indent=2, default=str), encoding="utf-8"
-        )
+        output.write_text(output_json, encoding="utf-8")
         console.print(f"[green]Results saved to {output}[/green]")
     else:
-        console.print(json.dumps(output_data, indent=2, default=str))
+        console.print(output_json)
 
     total_answers = sum(len(r.extractions) for r in results)
     found = sum(
@@ -29,6 +29,12 @@ class ScoutSettings(BaseSettings):
     llm_seed: int | None = None
     llm_timeout: float = 120.0
     llm_max_retries: int = 5
+    # Cap on in-flight completions per LLMClient, shared by every call
+    # path; None leaves concurrency to the callers
+    llm_max_concurrent: int | None = None
+    # Optional litellm connection shards (e.g. ``api_base``/``api_key`` per
+    # region or key), used round-robin per attempt; JSON list in the env var
+    llm_endpoints: list[dict[str, str]] = Field(default_factory=list)
     retry_jitter_factor: float = 0.5
     retry_max_delay: float = 30.0
 
@@ -156,6 +156,15 @@ class ObservabilityConfig(BaseSettings):
     otlp_endpoint: str = "http://localhost:4317"
     service_name: str = "scout-ai"
     log_level: str = "INFO"
+    # "auto" (dev on a TTY, else prod_full), "dev", "prod_full", or
+    # "prod_minimal" (JSON without logger name and stack-info processors)
+    log_profile: str = "auto"
+    # When False, agents still get an AuditHook but it registers no callbacks
+    enable_audit: bool = True
+    # Audit entries per batched record (1 logs each call immediately), and the
+    # age after which a partial batch is flushed on the next entry
+    audit_batch_size: int = 1
+    audit_flush_interval_seconds: float = 5.0
 
 
 class CachingConfig(BaseSettings):
@@ -175,6 +184,9 @@ class CachingConfig(BaseSettings):
     min_cacheable_tokens: int = 1024
     keepalive_interval_seconds: float = 240.0
     ttl_type: Literal["ephemeral", "long"] = "ephemeral"
+    response_cache_enabled: bool = False
+    response_cache_ttl_seconds: float = 3600.0
+    response_cache_max_size: int = 128
 
 
 class PDFFormattingConfig(BaseSettings):
@@ -90,9 +90,14 @@ class UnderwriterSummary:
 # ── APS Schema v1.0.0 models ────────────────────────────────────────
 
 
-@dataclass
+@dataclass(slots=True)
 class CitationRef:
-    """Inline citation reference linking a finding to its source page."""
+    """Inline citation reference linking a finding to its source page.
+
+    Slotted: a summary can hold thousands of these (every record's
+    citations plus the page-keyed ``citation_index``), and dropping the
+    per-instance ``__dict__`` roughly halves their footprint.
+    """
 
     page_number: int
     date: str = ""
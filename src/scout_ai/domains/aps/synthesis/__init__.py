@@ -2,6 +2,6 @@
 
 from __future__ import annotations
 
-from scout_ai.domains.aps.synthesis.pipeline import SynthesisPipeline
+from scout_ai.domains.aps.synthesis.pipeline import SynthesisPipeline, SynthesisResponseCache
 
-__all__ = ["SynthesisPipeline"]
+__all__ = ["SynthesisPipeline", "SynthesisResponseCache"]
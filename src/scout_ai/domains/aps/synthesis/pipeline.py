@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import sys
+import threading
+import time
+from collections import OrderedDict, defaultdict
 from datetime import datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Callable
 
 from scout_ai.domains.aps.models import (
     Allergy,
@@ -37,6 +42,55 @@ if TYPE_CHECKING:
 log = logging.getLogger(__name__)
 
 
+def _prompt_cache_key(static_text: str) -> str:
+    """Stable provider cache-routing key for a static synthesis prefix."""
+    return "synthesis-" + hashlib.sha256(static_text.encode("utf-8")).hexdigest()[:16]
+
+
+class SynthesisResponseCache:
+    """Thread-safe LRU cache of raw synthesis responses with TTL expiration.
+
+    Keys are SHA-256 digests of the model, temperature and full synthesis
+    prompt, so identical category summaries + metadata (e.g. a re-uploaded
+    document) sent to the same model skip the LLM round-trip.  Raw response
+    strings are cached rather than parsed summaries: parsing is cheap, and
+    the summary dataclasses are mutable.
+    """
+
+    def __init__(self, ttl_seconds: float = 3600.0, max_size: int = 128) -> None:
+        self._ttl = ttl_seconds
+        self._max_size = max_size
+        self._store: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._store.get(key)
+            if entry is None:
+                return None
+            ts, value = entry
+            if time.monotonic() - ts > self._ttl:
+                del self._store[key]
+                return None
+            self._store.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: str) -> None:
+        with self._lock:
+            self._store[key] = (time.monotonic(), value)
+            self._store.move_to_end(key)
+            while len(self._store) > self._max_size:
+                self._store.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._store.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._store)
+
+
 class SynthesisPipeline:
     """Aggregates extraction results into a structured underwriter summary.
 
@@ -46,11 +100,21 @@ class SynthesisPipeline:
 
     When ``cache_enabled`` is True, the synthesis system prompt is cached
     for reuse across multiple documents processed in the same session.
+
+    When a ``response_cache`` is supplied, LLM responses are reused for
+    byte-identical synthesis prompts until the cache entry expires.
     """
 
-    def __init__(self, client: LLMClient, *, cache_enabled: bool = False) -> None:
+    def __init__(
+        self,
+        client: LLMClient,
+        *,
+        cache_enabled: bool = False,
+        response_cache: SynthesisResponseCache | None = None,
+    ) -> None:
         self._client = client
         self._cache_enabled = cache_enabled
+        self._response_cache = response_cache
 
     # ── Legacy synthesis (unchanged API) ────────────────────────────
 
@@ -75,24 +139,11 @@ class SynthesisPipeline:
         category_summaries = self._prepare_category_summaries(extraction_results)
 
         # Phase 2: Generate narrative via LLM
-        system_prompt_text = get_prompt("aps", "synthesis", "SYNTHESIS_SYSTEM_PROMPT")
-        synthesis_prompt_template = get_prompt("aps", "synthesis", "SYNTHESIS_PROMPT")
-
-        system_prompt: str | None = system_prompt_text if self._cache_enabled else None
-
-        prompt_body = synthesis_prompt_template.format(
-            category_summaries=json.dumps(category_summaries, indent=2),
-            document_metadata=json.dumps(metadata),
-        )
-
-        if not self._cache_enabled:
-            # Inline system prompt into user message when caching is off
-            prompt_body = f"{system_prompt_text}\n\n{prompt_body}"
-
-        response = await self._client.complete(
-            prompt_body,
-            system_prompt=system_prompt,
-            cache_system=self._cache_enabled,
+        response = await self._complete_synthesis(
+            "SYNTHESIS_STATIC_PREFIX",
+            "SYNTHESIS_DYNAMIC_SUFFIX",
+            category_summaries,
+            metadata,
         )
 
         return self._parse_summary(response, extraction_results, metadata)
@@ -134,23 +185,11 @@ class SynthesisPipeline:
         citation_index = self._build_citation_index(extraction_results)
 
         # Phase 3: Generate structured response via LLM
-        system_prompt_text = get_prompt("aps", "synthesis", "SYNTHESIS_SYSTEM_PROMPT")
-        synthesis_prompt_template = get_prompt("aps", "synthesis", "SYNTHESIS_STRUCTURED_PROMPT")
-
-        system_prompt: str | None = system_prompt_text if self._cache_enabled else None
-
-        prompt_body = synthesis_prompt_template.format(
-            category_summaries=json.dumps(category_summaries, indent=2),
-            document_metadata=json.dumps(metadata),
-        )
-
-        if not self._cache_enabled:
-            prompt_body = f"{system_prompt_text}\n\n{prompt_body}"
-
-        response = await self._client.complete(
-            prompt_body,
-            system_prompt=system_prompt,
-            cache_system=self._cache_enabled,
+        response = await self._complete_synthesis(
+            "SYNTHESIS_STRUCTURED_STATIC_PREFIX",
+            "SYNTHESIS_STRUCTURED_DYNAMIC_SUFFIX",
+            category_summaries,
+            metadata,
         )
 
         aps_summary = self._parse_aps_summary(
@@ -165,6 +204,64 @@ class SynthesisPipeline:
 
         return aps_summary, validation_report
 
+    # ── Prompt assembly ─────────────────────────────────────────────
+
+    async def _complete_synthesis(
+        self,
+        static_prefix_name: str,
+        dynamic_suffix_name: str,
+        category_summaries: list[dict[str, Any]],
+        metadata: dict[str, Any],
+    ) -> str:
+        """Send a synthesis request with all invariant text ahead of document data.
+
+        The system prompt and the static instructions/schema form a stable
+        prefix; only the dynamic suffix varies per document.  When caching is
+        enabled the prefix travels as a ``cache_control``-tagged system
+        message, otherwise it is inlined ahead of the suffix so OpenAI-style
+        automatic prefix caching still matches.
+        """
+        system_prompt_text = get_prompt("aps", "synthesis", "SYNTHESIS_SYSTEM_PROMPT")
+        static_prefix = get_prompt("aps", "synthesis", static_prefix_name)
+        dynamic_suffix = get_prompt("aps", "synthesis", dynamic_suffix_name)
+
+        static_text = f"{system_prompt_text}\n\n{static_prefix}"
+        # Compact separators: indentation only costs prompt tokens and
+        # serialization time on the largest per-document payload.
+        dynamic_text = dynamic_suffix.format(
+            category_summaries=json.dumps(category_summaries, separators=(",", ":")),
+            document_metadata=json.dumps(metadata),
+        )
+        cache_key = _prompt_cache_key(static_text)
+
+        response_key = ""
+        if self._response_cache is not None:
+            # A cache shared across clients must not serve one model's answer for another
+            key_material = f"{self._client.model}\0{self._client.temperature}\0{static_text}\0{dynamic_text}"
+            response_key = hashlib.sha256(key_material.encode("utf-8")).hexdigest()
+            cached = self._response_cache.get(response_key)
+            if cached is not None:
+                log.debug("Synthesis response cache hit (%s)", response_key[:12])
+                return cached
+
+        if self._cache_enabled:
+            prompt_body = dynamic_text
+            system_prompt: str | None = static_text
+        else:
+            # Inline the static prefix into the user message when caching is off
+            prompt_body = f"{static_text}\n\n{dynamic_text}"
+            system_prompt = None
+
+        response = await self._client.complete(
+            prompt_body,
+            system_prompt=system_prompt,
+            cache_system=self._cache_enabled,
+            prompt_cache_key=cache_key,
+        )
+        if self._response_cache is not None and response:
+            self._response_cache.put(response_key, response)
+        return response
+
     # ── Category summary preparation ────────────────────────────────
 
     def _prepare_category_summaries(
@@ -221,28 +318,46 @@ class SynthesisPipeline:
         (page_number, first 50 chars of quote).
         """
         seen: set[tuple[int, str]] = set()
-        index: dict[int, list[CitationRef]] = {}
+        index: defaultdict[int, list[CitationRef]] = defaultdict(list)
 
         for batch in results:
             for extraction in (batch.extractions or []):
                 if extraction.confidence < 0.5:
                     continue
                 for c in extraction.citations:
-                    quote_prefix = c.verbatim_quote[:50] if c.verbatim_quote else ""
-                    dedup_key = (c.page_number, quote_prefix)
+                    page = c.page_number
+                    quote = c.verbatim_quote
+                    dedup_key = (page, quote[:50] if quote else "")
                     if dedup_key in seen:
                         continue
                     seen.add(dedup_key)
 
-                    ref = CitationRef(
-                        page_number=c.page_number,
+                    index[page].append(CitationRef(
+                        page_number=page,
                         source_type=c.section_type,
                         section_title=c.section_title,
-                        verbatim_quote=c.verbatim_quote,
-                    )
-                    index.setdefault(c.page_number, []).append(ref)
+                        verbatim_quote=quote,
+                    ))
+
+        # Plain dict so lookups of missing pages don't insert empty lists
+        return dict(index)
+
+    # ── Response decoding ───────────────────────────────────────────
 
-        return index
+    def _decode_response(self, response: str) -> Any:
+        """Decode the LLM response, trying a single strict JSON pass first.
+
+        Synthesis prompts ask for bare JSON, which most providers honour, so
+        one ``json.loads`` over the whole response usually suffices.  Fenced
+        or prose-wrapped output falls back to ``LLMClient.extract_json``.
+        """
+        stripped = response.strip()
+        if stripped.startswith("{"):
+            try:
+                return json.loads(stripped)
+            except json.JSONDecodeError:
+                pass
+        return self._client.extract_json(response)
 
     # ── Legacy response parser ──────────────────────────────────────
 
@@ -253,7 +368,7 @@ class SynthesisPipeline:
         metadata: dict[str, Any],
     ) -> UnderwriterSummary:
         """Parse LLM response into an UnderwriterSummary."""
-        parsed = self._client.extract_json(response)
+        parsed = self._decode_response(response)
 
         # Handle malformed LLM output: parsed may be a list, str, or empty
         if not isinstance(parsed, dict):
@@ -306,7 +421,10 @@ class SynthesisPipeline:
         citation_index: dict[int, list[CitationRef]],
     ) -> APSSummary:
         """Parse LLM response into an APSSummary with typed sections."""
-        parsed = self._client.extract_json(response)
+        parsed = self._decode_response(response)
+        if not isinstance(parsed, dict):
+            log.warning("Structured synthesis response was not a dict (got %s), using fallback", type(parsed).__name__)
+            parsed = {}
 
         total_answered = sum(
             len(batch.extractions or []) for batch in results
@@ -343,7 +461,7 @@ class SynthesisPipeline:
         # Parse risk classification
         rc_data = parsed.get("risk_classification", {})
         risk_classification = RiskClassification(
-            tier=rc_data.get("tier", ""),
+            tier=_intern_label(rc_data.get("tier", "")),
             table_rating=rc_data.get("table_rating", ""),
             debit_credits=rc_data.get("debit_credits", ""),
             rationale=rc_data.get("rationale", ""),
@@ -353,7 +471,7 @@ class SynthesisPipeline:
         red_flags = [
             RedFlag(
                 description=rf.get("description", ""),
-                severity=rf.get("severity", "MODERATE"),
+                severity=_intern_label(rf.get("severity", "MODERATE")),
                 category=rf.get("category", ""),
                 citations=[
                     CitationRef(
@@ -383,138 +501,187 @@ class SynthesisPipeline:
 
     @staticmethod
     def _parse_citation_refs(citations_data: list[dict[str, Any]]) -> list[CitationRef]:
-        """Parse a list of citation dicts into CitationRef objects."""
+        """Parse a list of citation dicts into CitationRef objects.
+
+        ``CitationRef`` is a plain dataclass, so construction is a bare
+        ``__init__`` with no validation pass; most LLM records carry no
+        citations at all, so the empty case returns before building a list.
+        """
+        if not citations_data:
+            return []
         return [
             CitationRef(
-                page_number=c.get("page_number", 0),
-                date=c.get("date", ""),
-                source_type=c.get("source_type", ""),
-                section_title=c.get("section_title", ""),
-                verbatim_quote=c.get("verbatim_quote", ""),
+                c.get("page_number", 0),
+                c.get("date", ""),
+                c.get("source_type", ""),
+                c.get("section_title", ""),
+                c.get("verbatim_quote", ""),
             )
             for c in citations_data
         ]
 
     @staticmethod
     def _parse_aps_section(data: dict[str, Any]) -> APSSection:
-        """Parse a single section dict into an APSSection."""
-        parse_refs = SynthesisPipeline._parse_citation_refs
-
-        findings = [
-            Finding(
-                text=f.get("text", ""),
-                severity=f.get("severity", "INFORMATIONAL"),
-                citations=parse_refs(f.get("citations", [])),
-            )
-            for f in data.get("findings", [])
-        ]
+        """Parse a single section dict into an APSSection.
 
-        conditions = [
-            Condition(
-                name=c.get("name", ""),
-                icd10_code=c.get("icd10_code", ""),
-                onset_date=c.get("onset_date", ""),
-                status=c.get("status", ""),
-                severity=c.get("severity", ""),
-                citations=parse_refs(c.get("citations", [])),
-            )
-            for c in data.get("conditions", [])
-        ]
+        Sparse sections are the norm (a demographics section has no labs or
+        imaging), so only record lists that are present and non-empty are
+        parsed; absent ones keep the dataclass's empty-list default.
+        """
+        records: dict[str, list[Any]] = {}
+        for key, parser in _SECTION_RECORD_PARSERS:
+            items = data.get(key)
+            if items:
+                records[key] = parser(items)
 
-        medications = [
-            Medication(
-                name=m.get("name", ""),
-                dose=m.get("dose", ""),
-                frequency=m.get("frequency", ""),
-                route=m.get("route", ""),
-                prescriber=m.get("prescriber", ""),
-                start_date=m.get("start_date", ""),
-                citations=parse_refs(m.get("citations", [])),
-            )
-            for m in data.get("medications", [])
-        ]
+        return APSSection(
+            section_key=data.get("section_key", ""),
+            section_number=data.get("section_number", ""),
+            title=data.get("title", ""),
+            content=data.get("content", ""),
+            source_categories=data.get("source_categories", []),
+            **records,
+        )
 
-        lab_results = [
-            LabResult(
-                test_name=lr.get("test_name", ""),
-                value=lr.get("value", ""),
-                unit=lr.get("unit", ""),
-                reference_range=lr.get("reference_range", ""),
-                flag=lr.get("flag", ""),
-                date=lr.get("date", ""),
-                citations=parse_refs(lr.get("citations", [])),
-            )
-            for lr in data.get("lab_results", [])
-        ]
 
-        imaging_results = [
-            ImagingResult(
-                modality=ir.get("modality", ""),
-                body_part=ir.get("body_part", ""),
-                finding=ir.get("finding", ""),
-                impression=ir.get("impression", ""),
-                date=ir.get("date", ""),
-                citations=parse_refs(ir.get("citations", [])),
-            )
-            for ir in data.get("imaging_results", [])
-        ]
+# ── Section record parsers ──────────────────────────────────────────
 
-        encounters = [
-            Encounter(
-                date=enc.get("date", ""),
-                provider=enc.get("provider", ""),
-                encounter_type=enc.get("encounter_type", ""),
-                summary=enc.get("summary", ""),
-                citations=parse_refs(enc.get("citations", [])),
-            )
-            for enc in data.get("encounters", [])
-        ]
+_parse_refs = SynthesisPipeline._parse_citation_refs
 
-        vital_signs = [
-            VitalSign(
-                name=vs.get("name", ""),
-                value=vs.get("value", ""),
-                date=vs.get("date", ""),
-                flag=vs.get("flag", ""),
-                citations=parse_refs(vs.get("citations", [])),
-            )
-            for vs in data.get("vital_signs", [])
-        ]
 
-        allergies = [
-            Allergy(
-                allergen=a.get("allergen", ""),
-                reaction=a.get("reaction", ""),
-                severity=a.get("severity", ""),
-                citations=parse_refs(a.get("citations", [])),
-            )
-            for a in data.get("allergies", [])
-        ]
+def _intern_label(value: Any) -> Any:
+    """Intern enum-like labels (severity, tier) so validation compares by identity."""
+    return sys.intern(value) if type(value) is str else value
 
-        surgical_history = [
-            SurgicalHistory(
-                procedure=sh.get("procedure", ""),
-                date=sh.get("date", ""),
-                outcome=sh.get("outcome", ""),
-                complications=sh.get("complications", ""),
-                citations=parse_refs(sh.get("citations", [])),
-            )
-            for sh in data.get("surgical_history", [])
-        ]
 
-        return APSSection(
-            section_key=data.get("section_key", ""),
-            section_number=data.get("section_number", ""),
-            title=data.get("title", ""),
-            content=data.get("content", ""),
-            source_categories=data.get("source_categories", []),
-            findings=findings,
-            conditions=conditions,
-            medications=medications,
-            lab_results=lab_results,
-            imaging_results=imaging_results,
-            encounters=encounters,
-            vital_signs=vital_signs,
-            allergies=allergies,
-            surgical_history=surgical_history,
+def _parse_findings(items: list[dict[str, Any]]) -> list[Finding]:
+    return [
+        Finding(
+            text=f.get("text", ""),
+            severity=_intern_label(f.get("severity", "INFORMATIONAL")),
+            citations=_parse_refs(f.get("citations", [])),
+        )
+        for f in items
+    ]
+
+
+def _parse_conditions(items: list[dict[str, Any]]) -> list[Condition]:
+    return [
+        Condition(
+            name=c.get("name", ""),
+            icd10_code=c.get("icd10_code", ""),
+            onset_date=c.get("onset_date", ""),
+            status=c.get("status", ""),
+            severity=_intern_label(c.get("severity", "")),
+            citations=_parse_refs(c.get("citations", [])),
+        )
+        for c in items
+    ]
+
+
+def _parse_medications(items: list[dict[str, Any]]) -> list[Medication]:
+    return [
+        Medication(
+            name=m.get("name", ""),
+            dose=m.get("dose", ""),
+            frequency=m.get("frequency", ""),
+            route=m.get("route", ""),
+            prescriber=m.get("prescriber", ""),
+            start_date=m.get("start_date", ""),
+            citations=_parse_refs(m.get("citations", [])),
+        )
+        for m in items
+    ]
+
+
+def _parse_lab_results(items: list[dict[str, Any]]) -> list[LabResult]:
+    return [
+        LabResult(
+            test_name=lr.get("test_name", ""),
+            value=lr.get("value", ""),
+            unit=lr.get("unit", ""),
+            reference_range=lr.get("reference_range", ""),
+            flag=lr.get("flag", ""),
+            date=lr.get("date", ""),
+            citations=_parse_refs(lr.get("citations", [])),
+        )
+        for lr in items
+    ]
+
+
+def _parse_imaging_results(items: list[dict[str, Any]]) -> list[ImagingResult]:
+    return [
+        ImagingResult(
+            modality=ir.get("modality", ""),
+            body_part=ir.get("body_part", ""),
+            finding=ir.get("finding", ""),
+            impression=ir.get("impression", ""),
+            date=ir.get("date", ""),
+            citations=_parse_refs(ir.get("citations", [])),
+        )
+        for ir in items
+    ]
+
+
+def _parse_encounters(items: list[dict[str, Any]]) -> list[Encounter]:
+    return [
+        Encounter(
+            date=enc.get("date", ""),
+            provider=enc.get("provider", ""),
+            encounter_type=enc.get("encounter_type", ""),
+            summary=enc.get("summary", ""),
+            citations=_parse_refs(enc.get("citations", [])),
         )
+        for enc in items
+    ]
+
+
+def _parse_vital_signs(items: list[dict[str, Any]]) -> list[VitalSign]:
+    return [
+        VitalSign(
+            name=vs.get("name", ""),
+            value=vs.get("value", ""),
+            date=vs.get("date", ""),
+            flag=vs.get("flag", ""),
+            citations=_parse_refs(vs.get("citations", [])),
+        )
+        for vs in items
+    ]
+
+
+def _parse_allergies(items: list[dict[str, Any]]) -> list[Allergy]:
+    return [
+        Allergy(
+            allergen=a.get("allergen", ""),
+            reaction=a.get("reaction", ""),
+            severity=a.get("severity", ""),
+            citations=_parse_refs(a.get("citations", [])),
+        )
+        for a in items
+    ]
+
+
+def _parse_surgical_history(items: list[dict[str, Any]]) -> list[SurgicalHistory]:
+    return [
+        SurgicalHistory(
+            procedure=sh.get("procedure", ""),
+            date=sh.get("date", ""),
+            outcome=sh.get("outcome", ""),
+            complications=sh.get("complications", ""),
+            citations=_parse_refs(sh.get("citations", [])),
+        )
+        for sh in items
+    ]
+
+
+_SECTION_RECORD_PARSERS: tuple[tuple[str, Callable[[list[dict[str, Any]]], list[Any]]], ...] = (
+    ("findings", _parse_findings),
+    ("conditions", _parse_conditions),
+    ("medications", _parse_medications),
+    ("lab_results", _parse_lab_results),
+    ("imaging_results", _parse_imaging_results),
+    ("encounters", _parse_encounters),
+    ("vital_signs", _parse_vital_signs),
+    ("allergies", _parse_allergies),
+    ("surgical_history", _parse_surgical_history),
+)
@@ -3,15 +3,26 @@
 from __future__ import annotations
 
 import re
+from collections.abc import Mapping
 
 from scout_ai.domains.aps.models import APSSummary
 from scout_ai.validation.models import Rule, RuleCategory, ValidationIssue
 
 
-def check_data_integrity(summary: APSSummary, rules: list[Rule]) -> list[ValidationIssue]:
-    """Run all data integrity checks against the summary."""
+def check_data_integrity(
+    summary: APSSummary,
+    rules: list[Rule] | None = None,
+    *,
+    rules_by_id: Mapping[str, Rule] | None = None,
+) -> list[ValidationIssue]:
+    """Run all data integrity checks against the summary.
+
+    The engine passes only its prebuilt ``rules_by_id`` index; direct
+    callers pass the ``rules`` list instead and it is indexed here.
+    """
     issues: list[ValidationIssue] = []
-    rules_by_id = {r.rule_id: r for r in rules if r.category == RuleCategory.DATA_INTEGRITY}
+    if rules_by_id is None:
+        rules_by_id = {r.rule_id: r for r in rules or () if r.category == RuleCategory.DATA_INTEGRITY}
 
     if "DI-001" in rules_by_id:
         issues.extend(_check_icd10_codes(summary, rules_by_id["DI-001"]))
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Mapping
+
 from scout_ai.domains.aps.models import APSSummary
 from scout_ai.validation.models import Rule, RuleCategory, ValidationIssue
 
@@ -17,13 +19,19 @@ _SEVERITY_ORDER = {
 
 def check_evidence_grounding(
     summary: APSSummary,
-    rules: list[Rule],
+    rules: list[Rule] | None = None,
     *,
     total_pages: int = 0,
+    rules_by_id: Mapping[str, Rule] | None = None,
 ) -> list[ValidationIssue]:
-    """Run all evidence grounding checks."""
+    """Run all evidence grounding checks.
+
+    The engine passes only its prebuilt ``rules_by_id`` index; direct
+    callers pass the ``rules`` list instead and it is indexed here.
+    """
     issues: list[ValidationIssue] = []
-    rules_by_id = {r.rule_id: r for r in rules if r.category == RuleCategory.EVIDENCE_GROUNDING}
+    if rules_by_id is None:
+        rules_by_id = {r.rule_id: r for r in rules or () if r.category == RuleCategory.EVIDENCE_GROUNDING}
 
     if "EG-001" in rules_by_id:
         issues.extend(_check_citations_required(summary, rules_by_id["EG-001"]))
@@ -2,7 +2,11 @@
 
 from __future__ import annotations
 
+import functools
 import re
+from collections.abc import Callable, Mapping
+from itertools import chain
+from operator import attrgetter
 
 from scout_ai.domains.aps.models import APSSummary
 from scout_ai.validation.models import Rule, RuleCategory, ValidationIssue
@@ -16,27 +20,47 @@ _SEVERITY_ORDER = {
     "CRITICAL": 4,
 }
 
+_NUMERIC_RE = re.compile(r"(\d+\.?\d*)")
+_LEADING_FLAGS_RE = re.compile(r"\(\?([aiLmsux]+)\)")
+_BMI_RISK_RE = re.compile(r"bmi|obes(?:e|ity)")
 
-def check_medical_business(summary: APSSummary, rules: list[Rule]) -> list[ValidationIssue]:
-    """Run all medical business checks against the summary."""
+
+def check_medical_business(
+    summary: APSSummary,
+    rules: list[Rule] | None = None,
+    *,
+    rules_by_id: Mapping[str, Rule] | None = None,
+) -> list[ValidationIssue]:
+    """Run all medical business checks against the summary.
+
+    The engine passes only its prebuilt ``rules_by_id`` index; direct
+    callers pass the ``rules`` list instead and it is indexed here.
+    """
     issues: list[ValidationIssue] = []
-    rules_by_id = {r.rule_id: r for r in rules if r.category == RuleCategory.MEDICAL_BUSINESS}
+    if rules_by_id is None:
+        rules_by_id = {r.rule_id: r for r in rules or () if r.category == RuleCategory.MEDICAL_BUSINESS}
 
-    if "MB-001" in rules_by_id:
-        issues.extend(_check_hba1c_severity(summary, rules_by_id["MB-001"]))
-    if "MB-002" in rules_by_id:
-        issues.extend(_check_bmi_risk_factor(summary, rules_by_id["MB-002"]))
-    if "MB-003" in rules_by_id:
-        issues.extend(_check_auto_critical_conditions(summary, rules_by_id["MB-003"]))
-    if "MB-004" in rules_by_id:
-        issues.extend(_check_controlled_substances(summary, rules_by_id["MB-004"]))
+    for rule_id, check in _CHECKS:
+        rule = rules_by_id.get(rule_id)
+        if rule is not None:
+            issues.extend(check(summary, rule))
 
     return issues
 
 
 def _parse_numeric(value: str) -> float | None:
-    """Extract the first numeric value from a string like '7.2 %' or '32.1'."""
-    match = re.search(r"(\d+\.?\d*)", value)
+    """Extract the first numeric value from a string like '7.2 %' or '32.1'.
+
+    When the first whitespace-separated token is already a plain decimal
+    (the common case) it goes straight to ``float()``; anything else, such as
+    ``'7.2%'`` or ``'BMI 32.1'``, falls back to the regex.
+    """
+    tokens = value.split(maxsplit=1)
+    if tokens:
+        head = tokens[0]
+        if head[0].isdecimal() and head.replace(".", "", 1).isdecimal():
+            return float(head)
+    match = _NUMERIC_RE.search(value)
     if match:
         try:
             return float(match.group(1))
@@ -45,101 +69,134 @@ def _parse_numeric(value: str) -> float | None:
     return None
 
 
+@functools.lru_cache(maxsize=64)
+def _compile_alternation(raw_patterns: tuple[str, ...]) -> re.Pattern[str] | None:
+    """Fuse rule patterns into one compiled alternation, once per distinct list.
+
+    A single regex scan per name replaces one scan per pattern.  Leading
+    global inline flags (e.g. ``(?i)`` in the YAML rules) are rewritten as
+    scoped groups so each alternative keeps its own flags.  Returns ``None``
+    for an empty list, which must match nothing rather than everything.
+    """
+    if not raw_patterns:
+        return None
+    parts = []
+    for pattern in raw_patterns:
+        flags = _LEADING_FLAGS_RE.match(pattern)
+        if flags:
+            parts.append(f"(?{flags.group(1)}:{pattern[flags.end():]})")
+        else:
+            parts.append(f"(?:{pattern})")
+    return re.compile("|".join(parts))
+
+
+@functools.lru_cache(maxsize=64)
+def _lower_names(names: tuple[str, ...]) -> frozenset[str]:
+    """Lowercased name set for a rule's name list, built once per distinct list.
+
+    Keyed on the tuple of names because ``Rule`` (with its ``params`` dict)
+    is unhashable.
+    """
+    return frozenset(n.lower() for n in names)
+
+
 def _check_hba1c_severity(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Flag HbA1c values above threshold with insufficient severity."""
-    test_names = {n.lower() for n in rule.params.get("test_names", [])}
+    test_names = _lower_names(tuple(rule.params.get("test_names", [])))
     threshold = rule.params.get("threshold", 7.0)
     min_severity = rule.params.get("min_severity", "MODERATE")
     min_severity_rank = _SEVERITY_ORDER.get(min_severity, 2)
     issues: list[ValidationIssue] = []
+    severity_rank = _SEVERITY_ORDER.get
+    parse_numeric = _parse_numeric
 
     for section in summary.sections:
+        # A related finding with adequate severity clears every lab in the section
+        section_findings_max = max(
+            (severity_rank(f.severity, 0) for f in section.findings),
+            default=0,
+        )
+        if section_findings_max >= min_severity_rank:
+            continue
+
         for lab in section.lab_results:
             if lab.test_name.lower() not in test_names:
                 continue
-            numeric = _parse_numeric(lab.value)
+            numeric = parse_numeric(lab.value)
             if numeric is None or numeric <= threshold:
                 continue
 
-            # Check if there's a related finding with adequate severity
-            section_findings_max = max(
-                (_SEVERITY_ORDER.get(f.severity, 0) for f in section.findings),
-                default=0,
-            )
-            if section_findings_max < min_severity_rank:
-                issues.append(
-                    ValidationIssue(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        severity=rule.severity,
-                        category=rule.category,
-                        message=(
-                            f"{lab.test_name} value {lab.value} exceeds threshold {threshold}; "
-                            f"expected severity >= {min_severity}"
-                        ),
-                        section_key=section.section_key,
-                        field_path="lab_results[].value",
-                        entity_name=lab.test_name,
-                        actual_value=lab.value,
-                        expected_hint=f"Severity >= {min_severity}",
-                    )
+            issues.append(
+                ValidationIssue(
+                    rule_id=rule.rule_id,
+                    rule_name=rule.name,
+                    severity=rule.severity,
+                    category=rule.category,
+                    message=(
+                        f"{lab.test_name} value {lab.value} exceeds threshold {threshold}; "
+                        f"expected severity >= {min_severity}"
+                    ),
+                    section_key=section.section_key,
+                    field_path="lab_results[].value",
+                    entity_name=lab.test_name,
+                    actual_value=lab.value,
+                    expected_hint=f"Severity >= {min_severity}",
                 )
+            )
 
     return issues
 
 
 def _check_bmi_risk_factor(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Flag BMI above threshold not listed in risk factors."""
-    vital_names = {n.lower() for n in rule.params.get("vital_names", [])}
+    vital_names = _lower_names(tuple(rule.params.get("vital_names", [])))
     threshold = rule.params.get("threshold", 30.0)
     issues: list[ValidationIssue] = []
 
-    risk_factors_lower = [rf.lower() for rf in summary.risk_factors]
+    # BMI or obesity already in risk factors means no vital can be flagged
+    if _BMI_RISK_RE.search("\n".join(summary.risk_factors).lower()):
+        return issues
+
+    parse_numeric = _parse_numeric
 
     for section in summary.sections:
         for vital in section.vital_signs:
             if vital.name.lower() not in vital_names:
                 continue
-            numeric = _parse_numeric(vital.value)
+            numeric = parse_numeric(vital.value)
             if numeric is None or numeric <= threshold:
                 continue
 
-            # Check if BMI or obesity is mentioned in risk factors
-            bmi_in_risks = any(
-                "bmi" in rf or "obesity" in rf or "obese" in rf
-                for rf in risk_factors_lower
-            )
-            if not bmi_in_risks:
-                issues.append(
-                    ValidationIssue(
-                        rule_id=rule.rule_id,
-                        rule_name=rule.name,
-                        severity=rule.severity,
-                        category=rule.category,
-                        message=(
-                            f"BMI {vital.value} exceeds {threshold} but is not reflected in risk_factors"
-                        ),
-                        section_key=section.section_key,
-                        field_path="vital_signs[].value",
-                        entity_name=vital.name,
-                        actual_value=vital.value,
-                        expected_hint="Add BMI/obesity to risk_factors",
-                    )
+            issues.append(
+                ValidationIssue(
+                    rule_id=rule.rule_id,
+                    rule_name=rule.name,
+                    severity=rule.severity,
+                    category=rule.category,
+                    message=(
+                        f"BMI {vital.value} exceeds {threshold} but is not reflected in risk_factors"
+                    ),
+                    section_key=section.section_key,
+                    field_path="vital_signs[].value",
+                    entity_name=vital.name,
+                    actual_value=vital.value,
+                    expected_hint="Add BMI/obesity to risk_factors",
                 )
+            )
 
     return issues
 
 
 def _check_auto_critical_conditions(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Flag conditions matching serious disease patterns that aren't CRITICAL."""
-    raw_patterns = rule.params.get("condition_patterns", [])
-    patterns = [re.compile(p) for p in raw_patterns]
+    combined = _compile_alternation(tuple(rule.params.get("condition_patterns", [])))
     issues: list[ValidationIssue] = []
+    if combined is None:
+        return issues
 
     for section in summary.sections:
         for condition in section.conditions:
-            matched = any(p.search(condition.name) for p in patterns)
-            if not matched:
+            if not combined.search(condition.name):
                 continue
             if condition.severity != "CRITICAL":
                 issues.append(
@@ -165,40 +222,49 @@ def _check_auto_critical_conditions(summary: APSSummary, rule: Rule) -> list[Val
 
 def _check_controlled_substances(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Flag concurrent controlled substances without a red flag."""
-    raw_patterns = rule.params.get("controlled_patterns", [])
-    patterns = [re.compile(p) for p in raw_patterns]
+    combined = _compile_alternation(tuple(rule.params.get("controlled_patterns", [])))
     min_concurrent = rule.params.get("min_concurrent", 2)
     issues: list[ValidationIssue] = []
+    if combined is None:
+        return issues
 
     # Collect all medications across sections
-    controlled_names: list[str] = []
-    for section in summary.sections:
-        for med in section.medications:
-            if any(p.search(med.name) for p in patterns):
-                controlled_names.append(med.name)
-
-    if len(controlled_names) >= min_concurrent:
-        # Check if a red flag exists for this
-        red_flag_exists = any(
-            "controlled" in rf.description.lower() or "substance" in rf.description.lower()
-            for rf in summary.red_flags
-        )
-        if not red_flag_exists:
-            issues.append(
-                ValidationIssue(
-                    rule_id=rule.rule_id,
-                    rule_name=rule.name,
-                    severity=rule.severity,
-                    category=rule.category,
-                    message=(
-                        f"{len(controlled_names)} concurrent controlled substances detected "
-                        f"({', '.join(controlled_names[:5])}) but no corresponding red flag found"
-                    ),
-                    field_path="medications[]",
-                    entity_name=", ".join(controlled_names[:3]),
-                    actual_value=str(len(controlled_names)),
-                    expected_hint=f"Add red flag when >= {min_concurrent} controlled substances",
-                )
+    meds = chain.from_iterable(map(attrgetter("medications"), summary.sections))
+    controlled_names = [m.name for m in meds if combined.search(m.name)]
+
+    if len(controlled_names) < min_concurrent:
+        return issues
+
+    # Check if a red flag exists for this (each description lowercased once)
+    red_flag_exists = any(
+        "controlled" in d or "substance" in d
+        for d in (rf.description.lower() for rf in summary.red_flags)
+    )
+    if not red_flag_exists:
+        issues.append(
+            ValidationIssue(
+                rule_id=rule.rule_id,
+                rule_name=rule.name,
+                severity=rule.severity,
+                category=rule.category,
+                message=(
+                    f"{len(controlled_names)} concurrent controlled substances detected "
+                    f"({', '.join(controlled_names[:5])}) but no corresponding red flag found"
+                ),
+                field_path="medications[]",
+                entity_name=", ".join(controlled_names[:3]),
+                actual_value=str(len(controlled_names)),
+                expected_hint=f"Add red flag when >= {min_concurrent} controlled substances",
             )
+        )
 
     return issues
+
+
+# Rule ID → check, in reporting order
+_CHECKS: tuple[tuple[str, Callable[[APSSummary, Rule], list[ValidationIssue]]], ...] = (
+    ("MB-001", _check_hba1c_severity),
+    ("MB-002", _check_bmi_risk_factor),
+    ("MB-003", _check_auto_critical_conditions),
+    ("MB-004", _check_controlled_substances),
+)
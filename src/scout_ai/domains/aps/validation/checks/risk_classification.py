@@ -2,14 +2,28 @@
 
 from __future__ import annotations
 
+import functools
+import sys
+from collections.abc import Mapping
+
 from scout_ai.domains.aps.models import APSSummary
 from scout_ai.validation.models import Rule, RuleCategory, ValidationIssue
 
 
-def check_risk_classification(summary: APSSummary, rules: list[Rule]) -> list[ValidationIssue]:
-    """Run all risk classification checks."""
+def check_risk_classification(
+    summary: APSSummary,
+    rules: list[Rule] | None = None,
+    *,
+    rules_by_id: Mapping[str, Rule] | None = None,
+) -> list[ValidationIssue]:
+    """Run all risk classification checks.
+
+    The engine passes only its prebuilt ``rules_by_id`` index; direct
+    callers pass the ``rules`` list instead and it is indexed here.
+    """
     issues: list[ValidationIssue] = []
-    rules_by_id = {r.rule_id: r for r in rules if r.category == RuleCategory.RISK_CLASSIFICATION}
+    if rules_by_id is None:
+        rules_by_id = {r.rule_id: r for r in rules or () if r.category == RuleCategory.RISK_CLASSIFICATION}
 
     if "RC-001" in rules_by_id:
         issues.extend(_check_valid_tier(summary, rules_by_id["RC-001"]))
@@ -19,9 +33,19 @@ def check_risk_classification(summary: APSSummary, rules: list[Rule]) -> list[Va
     return issues
 
 
+@functools.lru_cache(maxsize=64)
+def _label_set(labels: tuple[str, ...]) -> frozenset[str]:
+    """Interned frozenset of tier/severity labels, built once per distinct list.
+
+    Keyed on the tuple of labels because ``Rule`` (with its ``params`` dict)
+    is unhashable.
+    """
+    return frozenset(map(sys.intern, labels))
+
+
 def _check_valid_tier(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Validate the risk tier is a recognized value."""
-    allowed = set(rule.params.get("allowed_tiers", []))
+    allowed = _label_set(tuple(rule.params.get("allowed_tiers", [])))
     tier = summary.risk_classification.tier
     issues: list[ValidationIssue] = []
 
@@ -44,34 +68,26 @@ def _check_valid_tier(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
 
 def _check_critical_vs_tier(summary: APSSummary, rule: Rule) -> list[ValidationIssue]:
     """Flag contradiction: CRITICAL finding with Preferred Plus tier."""
-    incompatible_tiers = set(rule.params.get("incompatible_tiers", ["Preferred Plus"]))
-    trigger_severities = set(rule.params.get("trigger_severities", ["CRITICAL"]))
+    incompatible_tiers = _label_set(tuple(rule.params.get("incompatible_tiers", ["Preferred Plus"])))
+    trigger_severities = _label_set(tuple(rule.params.get("trigger_severities", ["CRITICAL"])))
     tier = summary.risk_classification.tier
     issues: list[ValidationIssue] = []
 
     if tier not in incompatible_tiers:
         return issues
 
-    # Check all findings and red flags for trigger severities
-    has_trigger = False
-    trigger_entity = ""
-    for section in summary.sections:
-        for finding in section.findings:
-            if finding.severity in trigger_severities:
-                has_trigger = True
-                trigger_entity = finding.text[:80]
-                break
-        if has_trigger:
-            break
-
-    if not has_trigger:
-        for rf in summary.red_flags:
-            if rf.severity in trigger_severities:
-                has_trigger = True
-                trigger_entity = rf.description[:80]
-                break
-
-    if has_trigger:
+    # First finding, then first red flag, at a trigger severity
+    trigger_entity = next(
+        (f.text[:80] for s in summary.sections for f in s.findings if f.severity in trigger_severities),
+        None,
+    )
+    if trigger_entity is None:
+        trigger_entity = next(
+            (rf.description[:80] for rf in summary.red_flags if rf.severity in trigger_severities),
+            None,
+        )
+
+    if trigger_entity is not None:
         issues.append(
             ValidationIssue(
                 rule_id=rule.rule_id,
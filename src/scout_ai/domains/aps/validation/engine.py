@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
 from typing import TYPE_CHECKING
 
 from scout_ai.domains.aps.validation.checks.data_integrity import check_data_integrity
@@ -11,6 +12,7 @@ from scout_ai.domains.aps.validation.checks.medical_business import check_medica
 from scout_ai.domains.aps.validation.checks.risk_classification import check_risk_classification
 from scout_ai.validation.models import (
     IssueSeverity,
+    Rule,
     RuleCategory,
     ValidationReport,
 )
@@ -27,10 +29,30 @@ class RulesEngine:
 
     Validation is pure computation — no LLM calls.  Each category's check
     module runs independently; a failure in one category does not block others.
+
+    Enabled rules are indexed by category and ID once per ruleset version,
+    so a rule edited in place takes effect with the next version bump.
     """
 
     def __init__(self, backend: IRulesBackend) -> None:
         self._backend = backend
+        # (ruleset version, enabled rule count, rules indexed by category and ID)
+        self._index: tuple[int, int, dict[RuleCategory, dict[str, Rule]]] | None = None
+
+    def _rules_index(self) -> tuple[int, int, dict[RuleCategory, dict[str, Rule]]]:
+        """Return the enabled rules indexed by category and ID.
+
+        Built once per ruleset version: the backend is only re-listed when
+        ``get_version()`` reports a new version.
+        """
+        version = self._backend.get_version()
+        if self._index is None or self._index[0] != version:
+            all_rules = self._backend.list_rules(enabled_only=True)
+            rules_by_category: dict[RuleCategory, dict[str, Rule]] = defaultdict(dict)
+            for rule in all_rules:
+                rules_by_category[rule.category][rule.rule_id] = rule
+            self._index = (version, len(all_rules), dict(rules_by_category))
+        return self._index
 
     def validate(
         self,
@@ -39,12 +61,11 @@ class RulesEngine:
         total_pages: int = 0,
     ) -> ValidationReport:
         """Run all enabled rules against the summary and return a report."""
-        all_rules = self._backend.list_rules(enabled_only=True)
-        rules_version = self._backend.get_version()
+        rules_version, rule_count, rules_by_category = self._rules_index()
 
         report = ValidationReport(
             document_id=summary.document_id,
-            total_rules_evaluated=len(all_rules),
+            total_rules_evaluated=rule_count,
             rules_version=rules_version,
         )
 
@@ -57,11 +78,11 @@ class RulesEngine:
         ]
 
         for category, dispatcher in dispatchers:
-            category_rules = [r for r in all_rules if r.category == category]
-            if not category_rules:
+            rules_by_id = rules_by_category.get(category)
+            if not rules_by_id:
                 continue
             try:
-                issues = dispatcher(summary, category_rules, total_pages=total_pages)
+                issues = dispatcher(summary, rules_by_id, total_pages=total_pages)
                 report.issues.extend(issues)
             except Exception:
                 log.exception("Validation category %s failed", category.value)
@@ -80,35 +101,35 @@ class RulesEngine:
     @staticmethod
     def _run_data_integrity(
         summary: APSSummary,
-        rules: list,
+        rules_by_id: dict[str, Rule],
         *,
         total_pages: int = 0,
     ) -> list:
-        return check_data_integrity(summary, rules)
+        return check_data_integrity(summary, rules_by_id=rules_by_id)
 
     @staticmethod
     def _run_medical_business(
         summary: APSSummary,
-        rules: list,
+        rules_by_id: dict[str, Rule],
         *,
         total_pages: int = 0,
     ) -> list:
-        return check_medical_business(summary, rules)
+        return check_medical_business(summary, rules_by_id=rules_by_id)
 
     @staticmethod
     def _run_evidence_grounding(
         summary: APSSummary,
-        rules: list,
+        rules_by_id: dict[str, Rule],
         *,
         total_pages: int = 0,
     ) -> list:
-        return check_evidence_grounding(summary, rules, total_pages=total_pages)
+        return check_evidence_grounding(summary, total_pages=total_pages, rules_by_id=rules_by_id)
 
     @staticmethod
     def _run_risk_classification(
         summary: APSSummary,
-        rules: list,
+        rules_by_id: dict[str, Rule],
         *,
         total_pages: int = 0,
     ) -> list:
-        return check_risk_classification(summary, rules)
+        return check_risk_classification(summary, rules_by_id=rules_by_id)
@@ -18,6 +18,7 @@ Usage::
 from __future__ import annotations
 
 import importlib
+import importlib.util
 import logging
 import pkgutil
 from dataclasses import dataclass, field
@@ -25,6 +26,10 @@ from typing import Any
 
 log = logging.getLogger(__name__)
 
+# Resolved dotted-path references.  Keyed on the path string rather than the
+# config instance, so equal references share an entry and ids are never reused.
+_RESOLVE_CACHE: dict[str, Any] = {}
+
 
 @dataclass(frozen=True)
 class DomainConfig:
@@ -32,7 +37,7 @@ class DomainConfig:
 
     All dotted-path references (e.g. ``prompts_module``,
     ``synthesis_pipeline``) are lazy-loaded on first access via
-    :meth:`resolve`.
+    :meth:`resolve` and cached for the life of the process.
     """
 
     name: str
@@ -70,7 +75,10 @@ class DomainConfig:
         dotted = getattr(self, attr, "")
         if not dotted:
             raise ValueError(f"Domain {self.name!r} has no {attr!r} configured")
-        return _import_dotted_path(dotted)
+        cached = _RESOLVE_CACHE.get(dotted)
+        if cached is None:
+            cached = _RESOLVE_CACHE[dotted] = _import_dotted_path(dotted)
+        return cached
 
 
 class DomainRegistry:
@@ -83,12 +91,15 @@ class DomainRegistry:
 
     def __init__(self) -> None:
         self._domains: dict[str, DomainConfig] = {}
+        self._sorted_cache: tuple[DomainConfig, ...] | None = None
+        self._auto_discovered = False
 
     def register(self, config: DomainConfig) -> None:
         """Register a domain config."""
         if config.name in self._domains:
             log.warning("Domain %r already registered, overwriting", config.name)
         self._domains[config.name] = config
+        self._sorted_cache = None
         log.debug("Registered domain: %s", config.name)
 
     def get(self, name: str) -> DomainConfig:
@@ -105,32 +116,48 @@ class DomainRegistry:
         return self._domains[name]
 
     def list_domains(self) -> list[DomainConfig]:
-        """Return all registered domain configs, sorted by name."""
-        return sorted(self._domains.values(), key=lambda d: d.name)
+        """Return all registered domain configs, sorted by name.
+
+        The sorted order is cached until the next :meth:`register`.
+        """
+        if self._sorted_cache is None:
+            self._sorted_cache = tuple(sorted(self._domains.values(), key=lambda d: d.name))
+        return list(self._sorted_cache)
 
     def has(self, name: str) -> bool:
         """Check if a domain is registered."""
         return name in self._domains
 
-    def auto_discover(self) -> None:
+    def auto_discover(self, *, force: bool = False) -> None:
         """Scan ``scout_ai.domains`` sub-packages for ``__domain__`` manifests.
 
         Each sub-package is expected to have a ``__domain__.py`` module with a
         module-level ``domain`` attribute of type :class:`DomainConfig`.
+
+        The scan runs once per registry; later calls are no-ops unless
+        *force* is set (e.g. after installing a new domain package).
         """
+        if self._auto_discovered and not force:
+            return
+
         import scout_ai.domains as domains_pkg
 
-        for importer, modname, ispkg in pkgutil.iter_modules(
-            domains_pkg.__path__, prefix="scout_ai.domains."
-        ):
-            if not ispkg:
-                continue
+        candidates = [
+            (modname, f"{modname}.__domain__")
+            for _, modname, ispkg in pkgutil.iter_modules(domains_pkg.__path__, prefix="scout_ai.domains.")
+            if ispkg
+        ]
 
-            domain_module_name = f"{modname}.__domain__"
+        for modname, domain_module_name in candidates:
+            # find_spec answers "no manifest" without raising and unwinding
+            # ImportError, but it imports the parent package, which may be broken
             try:
+                if importlib.util.find_spec(domain_module_name) is None:
+                    log.debug("No __domain__.py in %s, skipping", modname)
+                    continue
                 mod = importlib.import_module(domain_module_name)
             except ImportError:
-                log.debug("No __domain__.py in %s, skipping", modname)
+                log.debug("Failed to import %s, skipping", domain_module_name, exc_info=True)
                 continue
 
             config = getattr(mod, "domain", None)
@@ -143,6 +170,7 @@ class DomainRegistry:
 
             self.register(config)
 
+        self._auto_discovered = True
         log.info(
             "Auto-discovered %d domain(s): %s",
             len(self._domains),
@@ -175,10 +203,10 @@ def _import_dotted_path(dotted: str) -> Any:
     - ``module.path`` (no colon) — import as a module directly
     - ``bare_name`` — import as a top-level module
     """
-    if ":" in dotted:
-        module_path, obj_name = dotted.rsplit(":", 1)
-        mod = importlib.import_module(module_path)
-        return getattr(mod, obj_name)
+    module_path, sep, obj_name = dotted.rpartition(":")
+    if not sep:
+        # No colon — treat the whole string as a module path.
+        module_path = dotted
 
-    # No colon — treat the whole string as a module path.
-    return importlib.import_module(dotted)
+    mod = importlib.import_module(module_path)
+    return getattr(mod, obj_name) if sep else mod
@@ -8,7 +8,7 @@ from scout_ai.hooks.circuit_breaker_hook import CircuitBreakerHook, CircuitState
 from scout_ai.hooks.cost_hook import CostHook, UsageSummary, get_current_usage, reset_usage
 from scout_ai.hooks.dead_letter_hook import DeadLetterHook
 from scout_ai.hooks.logging_config import setup_logging
-from scout_ai.hooks.run_tracker import end_run, get_current_run, start_run, track_stage
+from scout_ai.hooks.run_tracker import end_run, get_current_run, on_run_end, start_run, track_stage
 from scout_ai.hooks.tracing import setup_tracing
 
 __all__ = [
@@ -22,6 +22,7 @@ __all__ = [
     "end_run",
     "get_current_run",
     "get_current_usage",
+    "on_run_end",
     "reset_usage",
     "setup_logging",
     "setup_tracing",
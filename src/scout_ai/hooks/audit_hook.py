@@ -2,45 +2,162 @@
 
 from __future__ import annotations
 
+import atexit
+import json
 import logging
+import threading
+import time
+import weakref
 from typing import TYPE_CHECKING, Any
 
+from scout_ai.hooks.run_tracker import get_current_run, on_run_end
+
 if TYPE_CHECKING:
     from strands.hooks.registry import HookRegistry
 
 log = logging.getLogger(__name__)
 
+_LLM_FIELDS = ("model", "prompt_tokens", "completion_tokens", "cached_tokens", "cache_creation", "latency_ms")
+_TOOL_FIELDS = ("tool", "status", "latency_ms")
+
+# Batching hooks still holding entries at interpreter exit get closed here
+_batching_hooks: weakref.WeakSet[AuditHook] = weakref.WeakSet()
+
+
+def _close_batching_hooks() -> None:
+    for hook in list(_batching_hooks):
+        hook.close()
+
+
+atexit.register(_close_batching_hooks)
+
 
 class AuditHook:
     """Strands HookProvider that logs model calls and tool executions.
 
     Registers callbacks for ``AfterModelCallEvent`` and ``AfterToolCallEvent``
     to create an audit trail of all agent activity.
+
+    With the default ``batch_size=1`` each call is logged immediately.  A
+    larger ``batch_size`` buffers entries per run (keyed by the active
+    :func:`~scout_ai.hooks.run_tracker.start_run` id) and emits a single
+    ``audit_batch`` record once that run's buffer is full, once
+    ``flush_interval_seconds`` have passed since its oldest entry, or when
+    the run ends (:func:`~scout_ai.hooks.run_tracker.end_run`), whichever
+    comes first.  The interval is checked lazily, when the next entry for
+    the same run arrives; there is no timer.  Anything still buffered is
+    emitted by :meth:`close`, which also runs at interpreter exit.
+
+    With ``enabled=False`` the hook registers no callbacks at all, so a
+    shared pipeline can keep it in its hook list without paying a dispatch
+    per model or tool call.
     """
 
+    def __init__(
+        self, *, batch_size: int = 1, flush_interval_seconds: float = 5.0, enabled: bool = True
+    ) -> None:
+        self._enabled = enabled
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_seconds
+        # run_id ("" outside a run) → (monotonic time of oldest entry, entries)
+        self._buffers: dict[str, tuple[float, list[tuple[Any, ...]]]] = {}
+        self._lock = threading.Lock()
+        if enabled and batch_size > 1:
+            on_run_end(self.flush)
+            _batching_hooks.add(self)
+
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
+        if not self._enabled:
+            return
         from strands.hooks.events import AfterModelCallEvent, AfterToolCallEvent
 
         registry.add_callback(AfterModelCallEvent, self._on_model_call)
         registry.add_callback(AfterToolCallEvent, self._on_tool_call)
 
     def _on_model_call(self, event: Any) -> None:
+        if not log.isEnabledFor(logging.INFO):
+            return
         usage = getattr(event, "usage", {}) or {}
+        model_id = getattr(event, "model_id", "unknown")
+        prompt_tokens = usage.get("inputTokens", usage.get("prompt_tokens", "?"))
+        completion_tokens = usage.get("outputTokens", usage.get("completion_tokens", "?"))
+        cached_tokens = usage.get("cache_read_input_tokens", 0)
+        cache_creation = usage.get("cache_creation_input_tokens", 0)
+        latency_ms = getattr(event, "latency_ms", "?")
+
+        if self._batch_size > 1:
+            self._append(
+                ("llm_call", model_id, prompt_tokens, completion_tokens, cached_tokens, cache_creation, latency_ms)
+            )
+            return
         log.info(
             "llm_call | model=%s prompt_tokens=%s completion_tokens=%s "
             "cached_tokens=%s cache_creation=%s latency_ms=%s",
-            getattr(event, "model_id", "unknown"),
-            usage.get("inputTokens", usage.get("prompt_tokens", "?")),
-            usage.get("outputTokens", usage.get("completion_tokens", "?")),
-            usage.get("cache_read_input_tokens", 0),
-            usage.get("cache_creation_input_tokens", 0),
-            getattr(event, "latency_ms", "?"),
+            model_id,
+            prompt_tokens,
+            completion_tokens,
+            cached_tokens,
+            cache_creation,
+            latency_ms,
         )
 
     def _on_tool_call(self, event: Any) -> None:
+        if not log.isEnabledFor(logging.INFO):
+            return
+        tool_name = getattr(event, "tool_name", "unknown")
+        status = getattr(event, "status", "unknown")
+        latency_ms = getattr(event, "latency_ms", "?")
+
+        if self._batch_size > 1:
+            self._append(("tool_call", tool_name, status, latency_ms))
+            return
         log.info(
             "tool_call | tool=%s status=%s latency_ms=%s",
-            getattr(event, "tool_name", "unknown"),
-            getattr(event, "status", "unknown"),
-            getattr(event, "latency_ms", "?"),
+            tool_name,
+            status,
+            latency_ms,
+        )
+
+    def _append(self, entry: tuple[Any, ...]) -> None:
+        run = get_current_run()
+        run_id = run.run_id if run is not None else ""
+        now = time.monotonic()
+        with self._lock:
+            started, entries = self._buffers.setdefault(run_id, (now, []))
+            entries.append(entry)
+            due = len(entries) >= self._batch_size or now - started >= self._flush_interval
+        if due:
+            self._flush_run(run_id)
+
+    def flush(self) -> None:
+        """Emit the current run's buffered entries as one ``audit_batch`` record.
+
+        Entries buffered by other, concurrently active runs are left alone.
+        No-op when the current run has nothing buffered.
+        """
+        run = get_current_run()
+        self._flush_run(run.run_id if run is not None else "")
+
+    def close(self) -> None:
+        """Emit every run's buffered entries, e.g. at shutdown."""
+        with self._lock:
+            run_ids = list(self._buffers)
+        for run_id in run_ids:
+            self._flush_run(run_id)
+
+    def _flush_run(self, run_id: str) -> None:
+        with self._lock:
+            _, entries = self._buffers.pop(run_id, (0.0, []))
+        if not entries:
+            return
+        log.info(
+            "audit_batch | %s",
+            json.dumps(
+                [
+                    {"event": kind, **dict(zip(_LLM_FIELDS if kind == "llm_call" else _TOOL_FIELDS, values))}
+                    for kind, *values in entries
+                ],
+                default=str,
+            ),
+            extra={"run_id": run_id},
         )
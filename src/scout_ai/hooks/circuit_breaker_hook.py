@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
 from enum import Enum
 from typing import TYPE_CHECKING, Any
@@ -24,6 +25,12 @@ class CircuitBreakerHook:
 
     Tracks consecutive failures and transitions through CLOSED → OPEN → HALF_OPEN states.
     When OPEN, raises an error before the model call to prevent wasted API calls.
+
+    State transitions are made under a lock, compare-and-set style, so
+    concurrent callbacks cannot interleave a transition and each one is
+    logged exactly once.  Internally the state is only ever a
+    :class:`CircuitState` member, so checks use identity (``is``) rather
+    than ``str`` equality.
     """
 
     def __init__(
@@ -33,19 +40,30 @@ class CircuitBreakerHook:
     ) -> None:
         self._failure_threshold = failure_threshold
         self._recovery_timeout = recovery_timeout_seconds
+        self._recovery_timeout_ns = int(recovery_timeout_seconds * 1_000_000_000)
         self._failure_count = 0
-        self._last_failure_time: float = 0.0
+        self._last_failure_ns = 0
         self._state = CircuitState.CLOSED
+        self._lock = threading.Lock()
 
     @property
     def state(self) -> CircuitState:
-        if self._state == CircuitState.OPEN:
-            elapsed = time.monotonic() - self._last_failure_time
-            if elapsed >= self._recovery_timeout:
-                self._state = CircuitState.HALF_OPEN
+        if self._state is CircuitState.OPEN:
+            elapsed_ns = time.monotonic_ns() - self._last_failure_ns
+            if elapsed_ns >= self._recovery_timeout_ns and self._compare_and_set(
+                CircuitState.OPEN, CircuitState.HALF_OPEN
+            ):
                 log.info("Circuit breaker → HALF_OPEN (recovery timeout elapsed)")
         return self._state
 
+    def _compare_and_set(self, expected: CircuitState, new: CircuitState) -> bool:
+        """Move to *new* only if still in *expected*; return whether this call did it."""
+        with self._lock:
+            if self._state is not expected:
+                return False
+            self._state = new
+            return True
+
     def register_hooks(self, registry: HookRegistry, **kwargs: Any) -> None:
         from strands.hooks.events import AfterModelCallEvent, BeforeModelCallEvent
 
@@ -54,7 +72,7 @@ class CircuitBreakerHook:
 
     def _before_model_call(self, event: Any) -> None:
         current = self.state
-        if current == CircuitState.OPEN:
+        if current is CircuitState.OPEN:
             raise RuntimeError(
                 f"Circuit breaker OPEN — {self._failure_count} consecutive failures. "
                 f"Retry after {self._recovery_timeout}s."
@@ -63,20 +81,25 @@ class CircuitBreakerHook:
     def _after_model_call(self, event: Any) -> None:
         error = getattr(event, "error", None)
         if error:
-            self._failure_count += 1
-            self._last_failure_time = time.monotonic()
-            if self._failure_count >= self._failure_threshold:
-                self._state = CircuitState.OPEN
-                log.warning(
-                    "Circuit breaker → OPEN after %d failures", self._failure_count
-                )
+            with self._lock:
+                self._failure_count += 1
+                self._last_failure_ns = time.monotonic_ns()
+                failures = self._failure_count
+                tripped = failures >= self._failure_threshold and self._state is not CircuitState.OPEN
+                if tripped:
+                    self._state = CircuitState.OPEN
+            if tripped:
+                log.warning("Circuit breaker → OPEN after %d failures", failures)
         else:
-            if self._state == CircuitState.HALF_OPEN:
+            with self._lock:
+                recovered = self._state is CircuitState.HALF_OPEN
+                self._failure_count = 0
+                self._state = CircuitState.CLOSED
+            if recovered:
                 log.info("Circuit breaker → CLOSED (successful call in half-open)")
-            self._failure_count = 0
-            self._state = CircuitState.CLOSED
 
     def reset(self) -> None:
         """Manually reset the circuit breaker to CLOSED."""
-        self._failure_count = 0
-        self._state = CircuitState.CLOSED
+        with self._lock:
+            self._failure_count = 0
+            self._state = CircuitState.CLOSED
@@ -10,9 +10,12 @@ if TYPE_CHECKING:
     from strands.hooks.registry import HookRegistry
 
 
-@dataclass
+@dataclass(slots=True)
 class UsageSummary:
-    """Accumulated token usage for a single request."""
+    """Accumulated token usage for a single request.
+
+    Slotted: one instance is updated on every model call.
+    """
 
     prompt_tokens: int = 0
     completion_tokens: int = 0
@@ -75,17 +78,24 @@ class CostHook:
 
     def _on_model_call(self, event: Any) -> None:
         usage_data = getattr(event, "usage", {}) or {}
-        summary = get_current_usage()
+        # Inlined get_current_usage(): skips a Python call on the hot path
+        try:
+            summary = _usage.get()
+        except LookupError:
+            summary = UsageSummary()
+            _usage.set(summary)
 
         prompt_toks = usage_data.get("inputTokens", usage_data.get("prompt_tokens", 0))
         completion_toks = usage_data.get("outputTokens", usage_data.get("completion_tokens", 0))
 
+        cached_toks = usage_data.get("cache_read_input_tokens", 0)
+
         summary.prompt_tokens += prompt_toks
         summary.completion_tokens += completion_toks
-        summary.cached_tokens += usage_data.get("cache_read_input_tokens", 0)
+        summary.cached_tokens += cached_toks
         summary.cache_creation_tokens += usage_data.get("cache_creation_input_tokens", 0)
         summary.call_count += 1
-        if usage_data.get("cache_read_input_tokens", 0) > 0:
+        if cached_toks > 0:
             summary.cache_hit_count += 1
         else:
             summary.cache_miss_count += 1
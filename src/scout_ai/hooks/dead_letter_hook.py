@@ -5,6 +5,8 @@ from __future__ import annotations
 import json
 import logging
 import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
@@ -59,11 +61,35 @@ class DeadLetterHook:
 
     def list_dead_letters(self, pipeline_id: str = "") -> list[dict[str, Any]]:
         """List all dead letter entries, optionally filtered by pipeline."""
+        return list(self.iter_dead_letters(pipeline_id))
+
+    def iter_dead_letters(self, pipeline_id: str = "", *, max_workers: int = 8) -> Iterator[dict[str, Any]]:
+        """Yield dead letter entries in key order, decoding one at a time.
+
+        Backend loads run on up to *max_workers* threads, so an S3-style
+        backend costs roughly one round-trip of wall time instead of one per
+        entry.  Missing or undecodable entries are skipped.
+        """
         prefix = f"_dead_letter/{pipeline_id}" if pipeline_id else "_dead_letter/"
-        entries = []
-        for key in self._backend.list_keys(prefix):
+        keys = self._backend.list_keys(prefix)
+        if max_workers <= 1 or len(keys) <= 1:
+            yield from self._decode_all(map(self._load_or_none, keys))
+            return
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+            yield from self._decode_all(pool.map(self._load_or_none, keys))
+
+    def _load_or_none(self, key: str) -> str | None:
+        try:
+            return self._backend.load(key)
+        except KeyError:
+            return None
+
+    @staticmethod
+    def _decode_all(payloads: Iterable[str | None]) -> Iterator[dict[str, Any]]:
+        for payload in payloads:
+            if payload is None:
+                continue
             try:
-                entries.append(json.loads(self._backend.load(key)))
-            except (KeyError, json.JSONDecodeError):
+                yield json.loads(payload)
+            except json.JSONDecodeError:
                 continue
-        return entries
@@ -1,17 +1,50 @@
 """Structured logging configuration using structlog.
 
 Provides JSON logs in production and colored console output in development.
+With structlog, records are handed to a background ``QueueListener`` so the
+calling thread (e.g. audit hooks on the agent path) only enqueues; rendering
+and stderr I/O happen on the listener thread.
 """
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from scout_ai.core.config import ObservabilityConfig
 
+# Background listener draining the root logger's queue; replaced on re-setup.
+_queue_listener: logging.handlers.QueueListener | None = None
+
+
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that enqueues records unformatted.
+
+    The stock ``prepare`` formats on the caller thread and flattens
+    ``record.msg`` to a string, which both defeats the point and breaks
+    structlog's ``ProcessorFormatter`` (it expects the event dict).  The queue
+    is in-process, so the record can be passed through as-is.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def _stop_queue_listener() -> None:
+    """Flush and stop the background log listener, if running."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
 
 def setup_logging(config: ObservabilityConfig) -> None:
     """Configure structured logging.
@@ -23,15 +56,28 @@ def setup_logging(config: ObservabilityConfig) -> None:
     try:
         import structlog
 
-        shared_processors: list = [
-            structlog.contextvars.merge_contextvars,
-            structlog.stdlib.add_log_level,
-            structlog.stdlib.add_logger_name,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-        ]
-
-        if sys.stderr.isatty():
+        profile = config.log_profile
+        if profile == "auto":
+            profile = "dev" if sys.stderr.isatty() else "prod_full"
+
+        # The chain is fixed for the life of the process, so pick the
+        # smallest one the profile needs rather than branching per event.
+        if profile == "prod_minimal":
+            shared_processors: list = [
+                structlog.contextvars.merge_contextvars,
+                structlog.stdlib.add_log_level,
+                structlog.processors.TimeStamper(fmt="iso"),
+            ]
+        else:
+            shared_processors = [
+                structlog.contextvars.merge_contextvars,
+                structlog.stdlib.add_log_level,
+                structlog.stdlib.add_logger_name,
+                structlog.processors.TimeStamper(fmt="iso"),
+                structlog.processors.StackInfoRenderer(),
+            ]
+
+        if profile == "dev":
             # Dev mode: colored console
             renderer = structlog.dev.ConsoleRenderer()
         else:
@@ -58,9 +104,15 @@ def setup_logging(config: ObservabilityConfig) -> None:
         handler = logging.StreamHandler(sys.stderr)
         handler.setFormatter(formatter)
 
+        global _queue_listener
+        _stop_queue_listener()
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+        _queue_listener.start()
+
         root = logging.getLogger()
         root.handlers.clear()
-        root.addHandler(handler)
+        root.addHandler(_DeferredQueueHandler(log_queue))
         root.setLevel(level)
 
     except ImportError:
@@ -14,16 +14,59 @@ Usage::
 
 from __future__ import annotations
 
+import inspect
+import logging
+import threading
+import time
 import uuid
+import weakref
 from contextlib import contextmanager
 from contextvars import ContextVar
 from datetime import datetime, timezone
-from typing import Generator
+from typing import Callable, Generator
 
 from scout_ai.models import RunAnalytics, StageMetrics
 
+# Resolved once at import rather than via a try/import on every bind/unbind
+try:
+    import structlog.contextvars as _structlog_contextvars
+except ImportError:
+    _structlog_contextvars = None  # type: ignore[assignment]
+
+log = logging.getLogger(__name__)
+
 _current_run: ContextVar[RunAnalytics | None] = ContextVar("scout_current_run", default=None)
 
+# Weakly-held callbacks invoked by ``end_run`` (e.g. AuditHook.flush)
+_run_end_callbacks: list[weakref.ref[Callable[[], None]]] = []
+_run_end_lock = threading.Lock()
+
+
+def on_run_end(callback: Callable[[], None]) -> None:
+    """Call *callback* from every subsequent :func:`end_run`.
+
+    Callbacks are held weakly (bound methods via ``WeakMethod``), so a hook
+    registering itself does not outlive its agent.
+    """
+    ref: weakref.ref[Callable[[], None]] = (
+        weakref.WeakMethod(callback) if inspect.ismethod(callback) else weakref.ref(callback)
+    )
+    with _run_end_lock:
+        _run_end_callbacks.append(ref)
+
+
+def _fire_run_end_callbacks() -> None:
+    with _run_end_lock:
+        _run_end_callbacks[:] = [ref for ref in _run_end_callbacks if ref() is not None]
+        callbacks = [ref() for ref in _run_end_callbacks]
+    for callback in callbacks:
+        if callback is None:
+            continue
+        try:
+            callback()
+        except Exception:
+            log.exception("Run-end callback %r failed", callback)
+
 
 def get_current_run() -> RunAnalytics | None:
     """Get the active RunAnalytics, or None if no run is active."""
@@ -41,12 +84,8 @@ def start_run(doc_id: str = "", run_id: str | None = None) -> RunAnalytics:
     _current_run.set(analytics)
 
     # Bind run_id to structlog context if available
-    try:
-        import structlog
-
-        structlog.contextvars.bind_contextvars(run_id=analytics.run_id)
-    except ImportError:
-        pass
+    if _structlog_contextvars is not None:
+        _structlog_contextvars.bind_contextvars(run_id=analytics.run_id)
 
     return analytics
 
@@ -58,15 +97,13 @@ def end_run() -> RunAnalytics | None:
         return None
 
     analytics.finalize()
+    # Before unbinding run_id, so flushed records still carry it
+    _fire_run_end_callbacks()
     _current_run.set(None)
 
     # Unbind run_id from structlog context
-    try:
-        import structlog
-
-        structlog.contextvars.unbind_contextvars("run_id")
-    except ImportError:
-        pass
+    if _structlog_contextvars is not None:
+        _structlog_contextvars.unbind_contextvars("run_id")
 
     return analytics
 
@@ -82,27 +119,20 @@ def track_stage(name: str) -> Generator[StageMetrics, None, None]:
     stage = StageMetrics(stage=name, started_at=datetime.now(timezone.utc))
 
     # Bind stage name to structlog context
-    try:
-        import structlog
-
-        structlog.contextvars.bind_contextvars(stage=name)
-    except ImportError:
-        pass
+    if _structlog_contextvars is not None:
+        _structlog_contextvars.bind_contextvars(stage=name)
 
+    t0 = time.perf_counter_ns()
     try:
         yield stage
     finally:
+        # Duration from the monotonic clock; the datetimes are for display
+        stage.duration_ms = (time.perf_counter_ns() - t0) / 1_000_000
         stage.ended_at = datetime.now(timezone.utc)
-        if stage.started_at:
-            stage.duration_ms = (stage.ended_at - stage.started_at).total_seconds() * 1000
 
         if analytics is not None:
             analytics.stages.append(stage)
 
         # Unbind stage from structlog context
-        try:
-            import structlog
-
-            structlog.contextvars.unbind_contextvars("stage")
-        except ImportError:
-            pass
+        if _structlog_contextvars is not None:
+            _structlog_contextvars.unbind_contextvars("stage")
@@ -2,11 +2,24 @@
 
 from __future__ import annotations
 
+import contextlib
+import functools
 import logging
+import os
+import uuid
 from pathlib import Path
 
 log = logging.getLogger(__name__)
 
+_UNSAFE_SEPARATORS = str.maketrans({"/": "_", "\\": "_"})
+
+
+@functools.lru_cache(maxsize=1024)
+def _file_name(key: str) -> str:
+    """Map a key to its flat ``.json`` file name (path separators become ``_``)."""
+    safe_key = key.translate(_UNSAFE_SEPARATORS)
+    return safe_key if safe_key.endswith(".json") else safe_key + ".json"
+
 
 class FilePersistenceBackend:
     """Stores data as JSON files in a local directory."""
@@ -16,15 +29,24 @@ class FilePersistenceBackend:
         self._base.mkdir(parents=True, exist_ok=True)
 
     def _key_path(self, key: str) -> Path:
-        safe_key = key.replace("/", "_").replace("\\", "_")
-        if not safe_key.endswith(".json"):
-            safe_key += ".json"
-        return self._base / safe_key
+        return self._base / _file_name(key)
 
     def save(self, key: str, data: str) -> None:
+        """Write ``data`` atomically: readers see the old file or the new one, never a partial write."""
         path = self._key_path(key)
         path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(data, encoding="utf-8")
+        # Unique sibling temp file; the .tmp suffix keeps it out of list_keys,
+        # and os.open's 0o666 mode honours the umask like write_text did
+        tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o666)
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                tmp_path.unlink()
+            raise
         log.debug(f"Saved {key} to {path}")
 
     def load(self, key: str) -> str:
@@ -42,9 +64,15 @@ class FilePersistenceBackend:
             path.unlink()
 
     def list_keys(self, prefix: str = "") -> list[str]:
+        # scandir's DirEntry carries the name and file type from the directory
+        # read itself, so no Path object or extra stat is needed per entry
         keys = []
-        for path in self._base.glob("*.json"):
-            key = path.stem
-            if key.startswith(prefix):
-                keys.append(key)
-        return sorted(keys)
+        with os.scandir(self._base) as entries:
+            for entry in entries:
+                name = entry.name
+                if name.endswith(".json"):
+                    key = name[:-5]
+                    if key.startswith(prefix) and entry.is_file():
+                        keys.append(key)
+        keys.sort()
+        return keys
@@ -14,26 +14,38 @@ from __future__ import annotations
 import argparse
 import importlib
 import logging
+import random
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timezone
 from types import ModuleType
+from typing import Any
 
 import boto3
+from botocore.config import Config
 
 logger = logging.getLogger(__name__)
 
 # ── Module registry ──────────────────────────────────────────────────
-# Maps (domain, category) to the dotted import path of the template module.
-
-_TEMPLATE_MODULES: dict[tuple[str, str], str] = {
-    ("aps", "indexing"): "scout_ai.prompts.templates.aps.indexing",
-    ("aps", "retrieval"): "scout_ai.prompts.templates.aps.retrieval",
-    ("aps", "extraction"): "scout_ai.prompts.templates.aps.extraction",
-    ("aps", "classification"): "scout_ai.prompts.templates.aps.classification",
-    ("base", "indexing_agent"): "scout_ai.prompts.templates.base.indexing_agent",
-    ("base", "retrieval_agent"): "scout_ai.prompts.templates.base.retrieval_agent",
-    ("base", "extraction_agent"): "scout_ai.prompts.templates.base.extraction_agent",
-}
+# (domain, category, dotted import path of the template module); only ever
+# iterated, never looked up by key.
+
+_TEMPLATE_MODULES: tuple[tuple[str, str, str], ...] = (
+    ("aps", "indexing", "scout_ai.prompts.templates.aps.indexing"),
+    ("aps", "retrieval", "scout_ai.prompts.templates.aps.retrieval"),
+    ("aps", "extraction", "scout_ai.prompts.templates.aps.extraction"),
+    ("aps", "classification", "scout_ai.prompts.templates.aps.classification"),
+    ("base", "indexing_agent", "scout_ai.prompts.templates.base.indexing_agent"),
+    ("base", "retrieval_agent", "scout_ai.prompts.templates.base.retrieval_agent"),
+    ("base", "extraction_agent", "scout_ai.prompts.templates.base.extraction_agent"),
+)
+
+# BatchWriteItem accepts at most 25 put/delete requests per call
+_BATCH_WRITE_LIMIT = 25
+_MAX_BATCH_ATTEMPTS = 8
+# BatchGetItem accepts at most 100 keys per call
+_BATCH_GET_LIMIT = 100
 
 # ── Helpers ───────────────────────────────────────────────────────────
 
@@ -41,10 +53,11 @@ _TEMPLATE_MODULES: dict[tuple[str, str], str] = {
 def _extract_prompts(module: ModuleType) -> dict[str, str]:
     """Return all prompts from the module's ``_PROMPT_DATA`` dict.
 
-    Reads directly from the ``_PROMPT_DATA`` dict to avoid triggering the
-    module's ``__getattr__`` shim (which would go through the registry).
+    Reads directly from the module namespace, so a module without
+    ``_PROMPT_DATA`` never reaches its ``__getattr__`` shim (which would go
+    through the registry).
     """
-    data = getattr(module, "_PROMPT_DATA", None)
+    data = vars(module).get("_PROMPT_DATA")
     if isinstance(data, dict):
         return {k: v for k, v in data.items() if isinstance(v, str)}
     return {}
@@ -56,7 +69,7 @@ def _build_item(
     name: str,
     prompt_text: str,
     timestamp: str,
-) -> dict[str, dict[str, str | bool]]:
+) -> dict[str, dict[str, Any]]:
     """Build a DynamoDB item dict (raw AttributeValue format)."""
     pk = f"{domain}#{category}#{name}"
     dimension_key = "lob#*#dept#*#uc#*#proc#*"
@@ -79,13 +92,10 @@ def _build_item(
 # ── Core logic ────────────────────────────────────────────────────────
 
 
-def seed_prompts(table_name: str, region: str) -> int:
-    """Write all file-based prompts to DynamoDB. Returns the count of items written."""
-    client = boto3.client("dynamodb", region_name=region)
-    timestamp = datetime.now(timezone.utc).isoformat()
-    written = 0
-
-    for (domain, category), module_path in _TEMPLATE_MODULES.items():
+def _collect_items(timestamp: str) -> list[dict[str, dict[str, Any]]]:
+    """Build the DynamoDB items for every prompt in every template module."""
+    items: list[dict[str, dict[str, Any]]] = []
+    for domain, category, module_path in _TEMPLATE_MODULES:
         logger.info("Loading module %s (domain=%s, category=%s)", module_path, domain, category)
         try:
             module = importlib.import_module(module_path)
@@ -99,18 +109,120 @@ def seed_prompts(table_name: str, region: str) -> int:
             continue
 
         for name, prompt_text in prompts.items():
-            item = _build_item(domain, category, name, prompt_text, timestamp)
-            pk_display = f"{domain}#{category}#{name}"
-            try:
-                client.put_item(TableName=table_name, Item=item)
-                written += 1
-                logger.info("  Wrote %s", pk_display)
-            except client.exceptions.ClientError as exc:
-                logger.error("  Failed to write %s: %s", pk_display, exc)
+            items.append(_build_item(domain, category, name, prompt_text, timestamp))
+    return items
+
 
+def _write_batch(client: Any, table_name: str, items: list[dict[str, dict[str, Any]]]) -> int:
+    """Write up to 25 items with one ``BatchWriteItem``, retrying unprocessed ones.
+
+    Returns the number of items DynamoDB accepted.
+    """
+    requests = [{"PutRequest": {"Item": item}} for item in items]
+    written = 0
+    for attempt in range(_MAX_BATCH_ATTEMPTS):
+        try:
+            response = client.batch_write_item(RequestItems={table_name: requests})
+        except client.exceptions.ClientError as exc:
+            logger.error("  Failed to write batch of %d items: %s", len(requests), exc)
+            return written
+
+        unprocessed = response.get("UnprocessedItems", {}).get(table_name, [])
+        written += len(requests) - len(unprocessed)
+        if not unprocessed:
+            return written
+        requests = unprocessed
+        if attempt < _MAX_BATCH_ATTEMPTS - 1:
+            time.sleep(random.uniform(0.1, 0.3) * 2**attempt)
+
+    for request in requests:
+        logger.error("  Gave up on %s after %d attempts", request["PutRequest"]["Item"]["PK"]["S"], attempt + 1)
     return written
 
 
+def _stored_prompt_texts(
+    client: Any, table_name: str, items: list[dict[str, dict[str, Any]]]
+) -> dict[str, str]:
+    """Return ``{PK: prompt_text}`` for the items already stored in the table.
+
+    Keys are fetched with ``BatchGetItem`` in chunks of 100; keys still
+    unprocessed after retries are treated as missing (and so get rewritten).
+    """
+    stored: dict[str, str] = {}
+    for start in range(0, len(items), _BATCH_GET_LIMIT):
+        keys = [{"PK": item["PK"], "SK": item["SK"]} for item in items[start : start + _BATCH_GET_LIMIT]]
+        request: dict[str, Any] = {table_name: {"Keys": keys, "ProjectionExpression": "PK, prompt_text"}}
+        for attempt in range(_MAX_BATCH_ATTEMPTS):
+            response = client.batch_get_item(RequestItems=request)
+            for row in response.get("Responses", {}).get(table_name, []):
+                if "prompt_text" in row:
+                    stored[row["PK"]["S"]] = row["prompt_text"]["S"]
+            request = response.get("UnprocessedKeys") or {}
+            if not request:
+                break
+            if attempt < _MAX_BATCH_ATTEMPTS - 1:
+                time.sleep(random.uniform(0.1, 0.3) * 2**attempt)
+    return stored
+
+
+def seed_prompts(
+    table_name: str,
+    region: str,
+    *,
+    batch_size: int = _BATCH_WRITE_LIMIT,
+    concurrency: int = 8,
+    skip_unchanged: bool = True,
+) -> int:
+    """Write all file-based prompts to DynamoDB.
+
+    Items are sent with ``BatchWriteItem`` in chunks of *batch_size*
+    (capped at DynamoDB's limit of 25), with up to *concurrency* chunks in
+    flight at once.  With *skip_unchanged*, prompts whose stored text
+    already matches are not rewritten.
+
+    Returns the number of prompts now current in the table (written or
+    already up to date).
+    """
+    concurrency = max(1, concurrency)
+    client = boto3.client(
+        "dynamodb",
+        region_name=region,
+        config=Config(
+            max_pool_connections=max(concurrency, 10),
+            tcp_keepalive=True,
+            retries={"max_attempts": 10, "mode": "adaptive"},
+            connect_timeout=3,
+            read_timeout=10,
+        ),
+    )
+    timestamp = datetime.now(timezone.utc).isoformat()
+    batch_size = max(1, min(batch_size, _BATCH_WRITE_LIMIT))
+
+    items = _collect_items(timestamp)
+    unchanged = 0
+    if skip_unchanged and items:
+        try:
+            stored = _stored_prompt_texts(client, table_name, items)
+        except client.exceptions.ClientError as exc:
+            logger.warning("Could not read existing prompts, writing all: %s", exc)
+            stored = {}
+        pending = [item for item in items if stored.get(item["PK"]["S"]) != item["prompt_text"]["S"]]
+        unchanged = len(items) - len(pending)
+        items = pending
+        logger.info("Skipping %d unchanged prompts", unchanged)
+
+    chunks = [items[start : start + batch_size] for start in range(0, len(items), batch_size)]
+    written = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(_write_batch, client, table_name, chunk): len(chunk) for chunk in chunks}
+        for future in as_completed(futures):
+            accepted = future.result()
+            written += accepted
+            logger.info("  Wrote %d/%d items in batch", accepted, futures[future])
+
+    return written + unchanged
+
+
 # ── CLI ───────────────────────────────────────────────────────────────
 
 
@@ -129,6 +241,23 @@ def main(argv: list[str] | None = None) -> None:
         default="us-east-1",
         help="AWS region (default: us-east-1)",
     )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=_BATCH_WRITE_LIMIT,
+        help="Items per BatchWriteItem call, at most 25 (default: 25)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=8,
+        help="BatchWriteItem calls in flight at once (default: 8)",
+    )
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Rewrite every prompt, even when the stored text is unchanged",
+    )
     parser.add_argument(
         "--log-level",
         default="INFO",
@@ -143,11 +272,17 @@ def main(argv: list[str] | None = None) -> None:
     )
 
     logger.info("Seeding table=%s in region=%s", args.table_name, args.region)
-    count = seed_prompts(table_name=args.table_name, region=args.region)
-    logger.info("Done. Wrote %d prompt items.", count)
+    count = seed_prompts(
+        table_name=args.table_name,
+        region=args.region,
+        batch_size=args.batch_size,
+        concurrency=args.concurrency,
+        skip_unchanged=not args.force,
+    )
+    logger.info("Done. %d prompt items up to date.", count)
 
     if count == 0:
-        logger.warning("No prompts were written -- check module imports.")
+        logger.warning("No prompts were seeded -- check module imports.")
         sys.exit(1)
 
 
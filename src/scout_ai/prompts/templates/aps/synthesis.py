@@ -2,6 +2,18 @@
 
 Prompts are stored in ``_PROMPT_DATA`` and exposed via ``__getattr__``
 which delegates to the prompt registry for DynamoDB / file resolution.
+
+Each synthesis prompt is split into a ``*_STATIC_PREFIX`` (instructions and
+output schema, invariant across documents) and a ``*_DYNAMIC_SUFFIX`` (the
+per-document ``str.format`` placeholders).  Keeping the invariant text first
+lets provider-side prompt caching match on an exact prefix.  Static prefixes
+contain literal JSON braces and must not be passed through ``str.format``.
+
+The pre-split names ``SYNTHESIS_PROMPT`` and ``SYNTHESIS_STRUCTURED_PROMPT``
+remain importable: they resolve to the assembled ``str.format`` template
+(escaped static prefix followed by the dynamic suffix).  Stored overrides
+must target the split names; overrides saved under the old names are no
+longer consulted by the synthesis pipeline.
 """
 
 from __future__ import annotations
@@ -21,45 +33,39 @@ Your task is to produce a clear, professional underwriter summary that:
 5. Uses only information present in the extraction results — do not infer or fabricate
 
 Always cite the extraction category and question ID when referencing specific findings.""",
-    "SYNTHESIS_PROMPT": """Given the following extraction results organized by category, \
-produce a structured underwriter summary report.
-
-Extraction Results:
-{category_summaries}
-
-Document Metadata: {document_metadata}
+    "SYNTHESIS_STATIC_PREFIX": """Given the extraction results organized by category and the \
+document metadata that follow, produce a structured underwriter summary report.
 
 Return a JSON object with this exact structure:
-{{
+{
     "patient_demographics": "<summary of patient identifying information>",
     "sections": [
-        {{
+        {
             "title": "<section title, e.g. 'Medical History', 'Current Conditions'>",
             "content": "<narrative summary of findings in this domain>",
             "source_categories": ["<category values used>"],
             "key_findings": ["<bullet point findings>"]
-        }}
+        }
     ],
     "risk_factors": ["<identified risk factors for underwriting>"],
     "overall_assessment": "<professional underwriting assessment paragraph>"
-}}
+}
 
 Produce sections for: Patient Demographics, Medical History, Current Conditions & Diagnoses, \
 Medications & Treatment, Laboratory & Imaging Results, Functional Status, \
 Mental Health, and Prognosis & Physician Opinion.
 
 Directly return the final JSON structure. Do not output anything else.""",
-    "SYNTHESIS_STRUCTURED_PROMPT": """Given the following extraction results organized by \
-category, produce a richly structured APS underwriter summary.
-
-Extraction Results:
+    "SYNTHESIS_DYNAMIC_SUFFIX": """Extraction Results:
 {category_summaries}
 
-Document Metadata: {document_metadata}
+Document Metadata: {document_metadata}""",
+    "SYNTHESIS_STRUCTURED_STATIC_PREFIX": """Given the extraction results organized by category \
+and the document metadata that follow, produce a richly structured APS underwriter summary.
 
 Return a JSON object with this exact structure:
-{{
-    "demographics": {{
+{
+    "demographics": {
         "full_name": "<patient full name>",
         "date_of_birth": "<DOB>",
         "age": "<age>",
@@ -70,9 +76,9 @@ Return a JSON object with this exact structure:
         "insurance_id": "<insurance ID>",
         "employer": "<employer>",
         "occupation": "<occupation>"
-    }},
+    },
     "sections": [
-        {{
+        {
             "section_key": "<one of: demographics, build_and_vitals, medical_history, \
 surgical_history, family_history, social_history, mental_health, medications, allergies, \
 lab_results, imaging_and_diagnostics, functional_status, encounter_chronology, \
@@ -81,105 +87,105 @@ red_flags, extraction_summary>",
             "content": "<narrative summary for this section>",
             "source_categories": ["<extraction category values used>"],
             "findings": [
-                {{
+                {
                     "text": "<clinical finding description>",
                     "severity": "<CRITICAL|SIGNIFICANT|MODERATE|MINOR|INFORMATIONAL>",
                     "citations": [
-                        {{
+                        {
                             "page_number": 0,
                             "date": "<date if known>",
                             "source_type": "<Progress Note|Lab Report|Imaging|etc.>"
-                        }}
+                        }
                     ]
-                }}
+                }
             ],
             "conditions": [
-                {{
+                {
                     "name": "<condition name>",
                     "icd10_code": "<ICD-10 code>",
                     "onset_date": "<onset date>",
                     "status": "<active|resolved|chronic>",
                     "severity": "<severity>"
-                }}
+                }
             ],
             "medications": [
-                {{
+                {
                     "name": "<drug name>",
                     "dose": "<dosage>",
                     "frequency": "<frequency>",
                     "route": "<oral|IV|etc.>",
                     "prescriber": "<prescriber>",
                     "start_date": "<start date>"
-                }}
+                }
             ],
             "lab_results": [
-                {{
+                {
                     "test_name": "<test>",
                     "value": "<result>",
                     "unit": "<unit>",
                     "reference_range": "<range>",
                     "flag": "<H|L|C or empty for normal>",
                     "date": "<date>"
-                }}
+                }
             ],
             "imaging_results": [
-                {{
+                {
                     "modality": "<X-ray|MRI|CT|etc.>",
                     "body_part": "<body part>",
                     "finding": "<finding>",
                     "impression": "<impression>",
                     "date": "<date>"
-                }}
+                }
             ],
             "encounters": [
-                {{
+                {
                     "date": "<encounter date>",
                     "provider": "<provider name>",
                     "encounter_type": "<office visit|ER|telehealth|etc.>",
                     "summary": "<brief summary>"
-                }}
+                }
             ],
             "vital_signs": [
-                {{
+                {
                     "name": "<BP|HR|Temp|etc.>",
                     "value": "<value with unit>",
                     "date": "<date>",
                     "flag": "<H|L or empty>"
-                }}
+                }
             ],
             "allergies": [
-                {{
+                {
                     "allergen": "<allergen>",
                     "reaction": "<reaction>",
                     "severity": "<mild|moderate|severe>"
-                }}
+                }
             ],
             "surgical_history": [
-                {{
+                {
                     "procedure": "<procedure>",
                     "date": "<date>",
                     "outcome": "<outcome>",
                     "complications": "<complications if any>"
-                }}
+                }
             ]
-        }}
+        }
     ],
-    "risk_classification": {{
+    "risk_classification": {
         "tier": "<Preferred Plus|Preferred|Standard Plus|Standard|Substandard|Postpone|Decline>",
         "table_rating": "<Table rating if substandard, e.g. Table 2>",
         "debit_credits": "<debit/credit adjustments>",
         "rationale": "<detailed rationale for the classification>"
-    }},
+    },
     "risk_factors": ["<identified risk factors>"],
     "red_flags": [
-        {{
+        {
             "description": "<red flag description>",
             "severity": "<CRITICAL|SIGNIFICANT|MODERATE>",
             "category": "<medication|behavioral|clinical|administrative>"
-        }}
+        }
     ],
     "overall_assessment": "<comprehensive underwriting assessment paragraph>"
-}}
+}
 
 Rules:
 - Only include typed data lists (conditions, medications, lab_results, etc.) in sections \
@@ -192,20 +198,46 @@ lab_results, imaging_and_diagnostics, functional_status, encounter_chronology.
 - Omit sections with no relevant findings.
 
 Directly return the final JSON structure. Do not output anything else.""",
+    "SYNTHESIS_STRUCTURED_DYNAMIC_SUFFIX": """Extraction Results:
+{category_summaries}
+
+Document Metadata: {document_metadata}""",
 }
 
 # ── PEP 562 module __getattr__ ──────────────────────────────────────
 
 _PROMPT_NAMES = frozenset(_PROMPT_DATA.keys())
 
+# Pre-split names → (static prefix, dynamic suffix) they are assembled from
+_LEGACY_ALIASES: dict[str, tuple[str, str]] = {
+    "SYNTHESIS_PROMPT": ("SYNTHESIS_STATIC_PREFIX", "SYNTHESIS_DYNAMIC_SUFFIX"),
+    "SYNTHESIS_STRUCTURED_PROMPT": (
+        "SYNTHESIS_STRUCTURED_STATIC_PREFIX",
+        "SYNTHESIS_STRUCTURED_DYNAMIC_SUFFIX",
+    ),
+}
+
+
+def assemble_legacy_prompt(name: str) -> str:
+    """Rebuild a pre-split synthesis template as a single ``str.format`` string."""
+    from scout_ai.prompts.registry import get_prompt
+
+    static_name, dynamic_name = _LEGACY_ALIASES[name]
+    static_prefix = get_prompt("aps", "synthesis", static_name)
+    dynamic_suffix = get_prompt("aps", "synthesis", dynamic_name)
+    escaped = static_prefix.replace("{", "{{").replace("}", "}}")
+    return f"{escaped}\n\n{dynamic_suffix}"
+
 
 def __getattr__(name: str) -> str:
     if name in _PROMPT_NAMES:
         from scout_ai.prompts.registry import get_prompt
 
         return get_prompt("aps", "synthesis", name)
+    if name in _LEGACY_ALIASES:
+        return assemble_legacy_prompt(name)
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def __dir__() -> list[str]:
-    return list(_PROMPT_NAMES) + ["_PROMPT_DATA"]
+    return list(_PROMPT_NAMES) + list(_LEGACY_ALIASES) + ["_PROMPT_DATA"]
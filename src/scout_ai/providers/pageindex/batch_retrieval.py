@@ -17,6 +17,7 @@ from scout_ai.models import (
     DocumentIndex,
     ExtractionQuestion,
     RetrievalResult,
+    TreeNode,
 )
 from scout_ai.providers.pageindex.client import LLMClient
 from scout_ai.providers.pageindex.retrieval import ScoutRetrieval
@@ -70,6 +71,15 @@ class BatchRetrieval:
             extra={"question_count": len(questions), "category_count": len(by_category)},
         )
 
+        # The tree JSON and node map are identical for every category, so
+        # build them once here rather than once per category search.  A tree
+        # that fits within top_k is never sent to the LLM, so skip its JSON.
+        node_map = create_node_mapping(index.tree)
+        if len(node_map) > self._settings.retrieval_top_k_nodes:
+            tree_structure = json.dumps(tree_to_dict(index.tree), indent=2)
+        else:
+            tree_structure = ""
+
         # Run one search per category with concurrency control
         sem = asyncio.Semaphore(self._settings.retrieval_max_concurrent)
         results: dict[str, RetrievalResult] = {}
@@ -79,7 +89,9 @@ class BatchRetrieval:
             cat_questions: list[ExtractionQuestion],
         ) -> tuple[str, RetrievalResult]:
             async with sem:
-                result = await self._category_search(index, category_str, cat_questions)
+                result = await self._category_search(
+                    category_str, cat_questions, tree_structure=tree_structure, node_map=node_map
+                )
                 return category_str, result
 
         tasks = [
@@ -104,15 +116,62 @@ class BatchRetrieval:
 
     async def _category_search(
         self,
-        index: DocumentIndex,
         category_str: str,
         questions: list[ExtractionQuestion],
+        *,
+        tree_structure: str,
+        node_map: dict[str, TreeNode],
     ) -> RetrievalResult:
-        """Build a synthesized query for a category and search the tree."""
+        """Build a synthesized query for a category and search the tree.
+
+        ``tree_structure`` and ``node_map`` are the serialized tree and its
+        node-ID mapping, shared across all categories of one batch.
+        """
         category_desc = self._category_descriptions.get(category_str, category_str)
+        top_k = self._settings.retrieval_top_k_nodes
+
+        if len(node_map) <= top_k:
+            # Every node fits within top_k, so the LLM could only return a
+            # subset of what we can return outright; skip the round trip
+            clean_ids = list(node_map)
+            reasoning = f"Tree has {len(node_map)} nodes (top_k={top_k}); returning all without an LLM search."
+        else:
+            clean_ids, reasoning = await self._select_node_ids(category_str, category_desc, tree_structure)
+
+        # Resolve nodes
+        retrieved_nodes: list[dict[str, Any]] = []
+        matched_nodes = []
+
+        for nid in clean_ids[:top_k]:
+            node = node_map.get(nid)
+            if node:
+                matched_nodes.append(node)
+                retrieved_nodes.append({
+                    "node_id": node.node_id,
+                    "title": node.title,
+                    "start_index": node.start_index,
+                    "end_index": node.end_index,
+                    "text": node.text,
+                })
+
+        source_pages = get_source_pages(matched_nodes) if matched_nodes else []
+
+        synthesized_query = f"[{category_str}] {category_desc}"
+        return RetrievalResult(
+            query=synthesized_query,
+            retrieved_nodes=retrieved_nodes,
+            source_pages=source_pages,
+            reasoning=reasoning,
+        )
 
+    async def _select_node_ids(
+        self,
+        category_str: str,
+        category_desc: str,
+        tree_structure: str,
+    ) -> tuple[list[str], str]:
+        """Ask the LLM which nodes answer a category; returns ``(node_ids, reasoning)``."""
         # Build a synthesized query from category description
-        tree_structure = json.dumps(tree_to_dict(index.tree), indent=2)
         if not self._category_search_prompt:
             from scout_ai.prompts.registry import get_prompt
 
@@ -142,30 +201,4 @@ class BatchRetrieval:
                 clean_ids.append(nid)
             elif isinstance(nid, dict) and "node_id" in nid:
                 clean_ids.append(str(nid["node_id"]))
-
-        # Resolve nodes
-        node_map = create_node_mapping(index.tree)
-        retrieved_nodes: list[dict[str, Any]] = []
-        matched_nodes = []
-
-        for nid in clean_ids[: self._settings.retrieval_top_k_nodes]:
-            node = node_map.get(nid)
-            if node:
-                matched_nodes.append(node)
-                retrieved_nodes.append({
-                    "node_id": node.node_id,
-                    "title": node.title,
-                    "start_index": node.start_index,
-                    "end_index": node.end_index,
-                    "text": node.text,
-                })
-
-        source_pages = get_source_pages(matched_nodes) if matched_nodes else []
-
-        synthesized_query = f"[{category_str}] {category_desc}"
-        return RetrievalResult(
-            query=synthesized_query,
-            retrieved_nodes=retrieved_nodes,
-            source_pages=source_pages,
-            reasoning=reasoning,
-        )
+        return clean_ids, reasoning
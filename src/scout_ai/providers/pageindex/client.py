@@ -8,9 +8,13 @@ Supports ``anthropic/``, ``bedrock/``, ``openai/`` model prefixes transparently.
 from __future__ import annotations
 
 import asyncio
+import functools
+import itertools
 import json
 import logging
 import random
+from collections.abc import AsyncIterator, Iterator
+from contextlib import AbstractAsyncContextManager, nullcontext
 from typing import Any
 
 from scout_ai.config import ScoutSettings
@@ -18,17 +22,66 @@ from scout_ai.exceptions import LLMClientError, NonRetryableError, RetryableErro
 
 log = logging.getLogger(__name__)
 
+# Python 3.12+: batch tasks run their first step synchronously, so an
+# uncontended semaphore is acquired without an extra event-loop round-trip
+_eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+
+
+@functools.lru_cache(maxsize=32)
+def _supports_prompt_cache_key(model: str) -> bool:
+    """Whether LiteLLM accepts ``prompt_cache_key`` for *model*.
+
+    Only OpenAI-style providers take it; sending it to ``anthropic/`` or
+    ``bedrock/`` models raises ``UnsupportedParamsError``.
+    """
+    from litellm import get_supported_openai_params
+
+    try:
+        supported = get_supported_openai_params(model=model)
+    except Exception:
+        return False
+    return "prompt_cache_key" in (supported or ())
+
 
 class LLMClient:
-    """Async LLM client using LiteLLM with optional Anthropic prompt caching."""
+    """Async LLM client using LiteLLM with optional Anthropic prompt caching.
+
+    When ``llm_max_concurrent`` is set, one client instance is one
+    concurrency budget: single calls and every overlapping batch share it.
+    When ``llm_endpoints`` lists several connection shards, attempts are
+    spread across them round-robin.
+    """
 
     def __init__(self, settings: ScoutSettings) -> None:
         self._settings = settings
+        self._sem: asyncio.BoundedSemaphore | None = None
+        self._sem_loop: asyncio.AbstractEventLoop | None = None
+        endpoints = getattr(settings, "llm_endpoints", None)
+        self._endpoints: Iterator[dict[str, str]] | None = itertools.cycle(endpoints) if endpoints else None
 
     @property
     def model(self) -> str:
         return self._settings.llm_model
 
+    @property
+    def temperature(self) -> float:
+        return self._settings.llm_temperature
+
+    def _concurrency_limit(self) -> AbstractAsyncContextManager[Any]:
+        """Return the client-wide semaphore, or a no-op context when uncapped.
+
+        Created lazily inside the running loop and rebuilt if the client is
+        reused from a different event loop.
+        """
+        limit = getattr(self._settings, "llm_max_concurrent", None)
+        if not limit:
+            return nullcontext()
+        loop = asyncio.get_running_loop()
+        if self._sem is None or self._sem_loop is not loop:
+            self._sem = asyncio.BoundedSemaphore(limit)
+            self._sem_loop = loop
+        return self._sem
+
     @staticmethod
     def _is_retryable(exc: Exception) -> bool:
         """Classify whether an LLM API error should be retried.
@@ -58,6 +111,7 @@ class LLMClient:
         model: str | None = None,
         chat_history: list[dict[str, Any]] | None = None,
         temperature: float | None = None,
+        prompt_cache_key: str | None = None,
     ) -> str:
         """Single completion, returns content string.
 
@@ -70,6 +124,10 @@ class LLMClient:
             model: Override model ID. Supports LiteLLM prefixes (e.g. ``anthropic/``).
             chat_history: Prior conversation messages.
             temperature: Override temperature.
+            prompt_cache_key: Optional routing hint for OpenAI prompt caching.
+                Requests sharing a key and a common prompt prefix are routed
+                to the same cache shard.  Dropped for models whose provider
+                does not accept it.
         """
         content, _ = await self.complete_with_finish_reason(
             prompt,
@@ -78,6 +136,7 @@ class LLMClient:
             model=model,
             chat_history=chat_history,
             temperature=temperature,
+            prompt_cache_key=prompt_cache_key,
         )
         return content
 
@@ -90,6 +149,7 @@ class LLMClient:
         model: str | None = None,
         chat_history: list[dict[str, Any]] | None = None,
         temperature: float | None = None,
+        prompt_cache_key: str | None = None,
     ) -> tuple[str, str]:
         """Completion returning ``(content, finish_reason)``.
 
@@ -118,22 +178,32 @@ class LLMClient:
         jitter_factor = getattr(self._settings, "retry_jitter_factor", 0.5)
         max_delay = getattr(self._settings, "retry_max_delay", 30.0)
 
+        # Request kwargs are identical on every attempt, so build them once
+        kwargs: dict[str, Any] = {
+            "model": effective_model,
+            "messages": messages,
+            "temperature": effective_temp,
+            "top_p": self._settings.llm_top_p,
+            "timeout": self._settings.llm_timeout,
+        }
+        if self._settings.llm_seed is not None:
+            kwargs["seed"] = self._settings.llm_seed
+        if prompt_cache_key is not None and _supports_prompt_cache_key(effective_model):
+            kwargs["prompt_cache_key"] = prompt_cache_key
+
         last_error: Exception | None = None
         for attempt in range(max_retries):
             try:
-                kwargs: dict[str, Any] = {
-                    "model": effective_model,
-                    "messages": messages,
-                    "temperature": effective_temp,
-                    "top_p": self._settings.llm_top_p,
-                    "timeout": self._settings.llm_timeout,
-                }
-                if self._settings.llm_seed is not None:
-                    kwargs["seed"] = self._settings.llm_seed
-                response = await acompletion(**kwargs)
-                content = response.choices[0].message.content or ""
-                reason = response.choices[0].finish_reason
-                mapped_reason = "max_output_reached" if reason == "length" else "finished"
+                # Each attempt goes to the next shard, so a rate-limited
+                # endpoint is retried against a different one
+                async with self._concurrency_limit():
+                    if self._endpoints is None:
+                        response = await acompletion(**kwargs)
+                    else:
+                        response = await acompletion(**{**kwargs, **next(self._endpoints)})
+                choice = response.choices[0]
+                content = choice.message.content or ""
+                mapped_reason = "max_output_reached" if choice.finish_reason == "length" else "finished"
                 return content, mapped_reason
 
             except Exception as e:
@@ -175,14 +245,54 @@ class LLMClient:
         content is cached once and reused across all batch calls — the core
         mechanism for Anthropic prompt caching cost savings.
 
+        ``max_concurrent`` caps this batch only when the client has no
+        ``llm_max_concurrent`` budget; otherwise the shared budget applies.
+
         Returns results in order; failed tasks return empty strings.
         """
-        sem = asyncio.Semaphore(max_concurrent or self._settings.retrieval_max_concurrent)
+        results = [""] * len(prompts)
+        async for index, content in self.complete_batch_iter(
+            prompts,
+            system_prompt=system_prompt,
+            cache_system=cache_system,
+            max_concurrent=max_concurrent,
+            timeout_per_task=timeout_per_task,
+        ):
+            results[index] = content
+        return results
+
+    async def complete_batch_iter(
+        self,
+        prompts: list[str],
+        *,
+        system_prompt: str | None = None,
+        cache_system: bool = False,
+        max_concurrent: int | None = None,
+        timeout_per_task: float = 120.0,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Like :meth:`complete_batch`, but yield ``(index, content)`` as each call finishes.
+
+        Fast completions reach the caller without waiting for the slowest
+        prompt in the batch.  ``index`` is the position in ``prompts``.
+        Identical prompts share one LLM call; its result is yielded once for
+        each of their indices.
+        """
+        # With llm_max_concurrent set, complete() already waits on the
+        # client-wide semaphore; only an uncapped client needs a per-batch one
+        sem: AbstractAsyncContextManager[Any] = (
+            nullcontext()
+            if getattr(self._settings, "llm_max_concurrent", None)
+            else asyncio.Semaphore(max_concurrent or self._settings.retrieval_max_concurrent)
+        )
+
+        indices_by_prompt: dict[str, list[int]] = {}
+        for i, p in enumerate(prompts):
+            indices_by_prompt.setdefault(p, []).append(i)
 
-        async def _bounded(prompt: str) -> str:
+        async def _bounded(prompt: str) -> tuple[str, str]:
             async with sem:
                 try:
-                    return await asyncio.wait_for(
+                    return prompt, await asyncio.wait_for(
                         self.complete(
                             prompt,
                             system_prompt=system_prompt,
@@ -192,9 +302,21 @@ class LLMClient:
                     )
                 except (asyncio.TimeoutError, LLMClientError) as e:
                     log.warning("Batch task failed: %s", e)
-                    return ""
+                    return prompt, ""
 
-        return await asyncio.gather(*[_bounded(p) for p in prompts])
+        loop = asyncio.get_running_loop()
+        if _eager_task_factory is not None:
+            tasks = [_eager_task_factory(loop, _bounded(p)) for p in indices_by_prompt]
+        else:
+            tasks = [loop.create_task(_bounded(p)) for p in indices_by_prompt]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                prompt, content = await next_done
+                for index in indices_by_prompt[prompt]:
+                    yield index, content
+        finally:
+            for task in tasks:
+                task.cancel()
 
     # ── JSON extraction (static) ─────────────────────────────────────
 
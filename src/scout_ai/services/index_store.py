@@ -35,4 +35,5 @@ class IndexStore:
         path = self._index_path(doc_id)
         if not path.is_file():
             raise FileNotFoundError(f"No index found for doc_id={doc_id} at {path}")
-        return DocumentIndex.model_validate_json(path.read_text(encoding="utf-8"))
+        # pydantic-core parses the UTF-8 bytes directly; no intermediate str copy
+        return DocumentIndex.model_validate_json(path.read_bytes())
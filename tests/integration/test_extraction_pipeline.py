@@ -65,10 +65,12 @@ def test_index() -> DocumentIndex:
 
 @pytest.fixture
 def pipeline():
+    # top_k below the 2-node test tree keeps category retrieval on the LLM path
     settings = ScoutSettings(
         llm_base_url="http://test-llm:4000/v1",
         llm_api_key="test-key",
         llm_model="test-model",
+        retrieval_top_k_nodes=1,
     )
     client = LLMClient(settings)
     retrieval = ScoutRetrieval(settings, client)
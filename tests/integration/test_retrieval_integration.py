@@ -119,9 +119,22 @@ class TestSingleQueryRetrieval:
         assert result.source_pages == [1, 2, 3, 4]
 
 
+@pytest.fixture
+def narrow_retrieval():
+    """Retrieval whose top_k is smaller than the test tree, so the LLM is consulted."""
+    settings = ScoutSettings(
+        llm_base_url="http://test-llm:4000/v1",
+        llm_api_key="test-key",
+        llm_model="test-model",
+        retrieval_top_k_nodes=2,
+    )
+    client = LLMClient(settings)
+    return ScoutRetrieval(settings, client)
+
+
 @pytest.mark.asyncio
 class TestBatchRetrieval:
-    async def test_batch_groups_by_category(self, retrieval, test_index):
+    async def test_batch_groups_by_category(self, narrow_retrieval, test_index):
         questions = [
             ExtractionQuestion(
                 question_id="q1",
@@ -150,9 +163,25 @@ class TestBatchRetrieval:
             )
 
         with patch("litellm.acompletion", side_effect=_mock_acomp):
-            results = await retrieval.batch_retrieve(test_index, questions)
+            results = await narrow_retrieval.batch_retrieve(test_index, questions)
 
         assert ExtractionCategory.DEMOGRAPHICS in results
         assert ExtractionCategory.LAB_RESULTS in results
         # One LLM call per category, not per question
         assert call_count == 2
+
+    async def test_small_tree_skips_llm(self, retrieval, test_index):
+        questions = [
+            ExtractionQuestion(
+                question_id="q1",
+                category=ExtractionCategory.LAB_RESULTS,
+                question_text="WBC count?",
+            ),
+        ]
+
+        with patch("litellm.acompletion", side_effect=AssertionError("LLM should not be called")):
+            results = await retrieval.batch_retrieve(test_index, questions)
+
+        result = results[ExtractionCategory.LAB_RESULTS]
+        assert [n["node_id"] for n in result.retrieved_nodes] == ["0000", "0001", "0002"]
+        assert result.source_pages == [1, 2, 3, 4, 5]
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import dataclasses
+
 from scout_ai.synthesis.models import (
     Allergy,
     APSSection,
@@ -56,6 +58,11 @@ class TestCitationRef:
         assert ref.section_title == ""
         assert ref.verbatim_quote == ""
 
+    def test_slotted_and_serializable(self) -> None:
+        ref = CitationRef(page_number=3, date="01/2024")
+        assert not hasattr(ref, "__dict__")
+        assert dataclasses.asdict(ref)["date"] == "01/2024"
+
 
 class TestFinding:
     def test_defaults(self) -> None:
@@ -0,0 +1,145 @@
+"""Tests for AuditHook logging and batching."""
+
+from __future__ import annotations
+
+import contextvars
+import json
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from scout_ai.hooks.audit_hook import AuditHook
+from scout_ai.hooks.run_tracker import end_run, start_run
+
+
+def _model_event() -> MagicMock:
+    event = MagicMock()
+    event.model_id = "test-model"
+    event.usage = {"inputTokens": 10, "outputTokens": 5, "cache_read_input_tokens": 2}
+    event.latency_ms = 120
+    return event
+
+
+def _tool_event() -> MagicMock:
+    event = MagicMock()
+    event.tool_name = "search"
+    event.status = "success"
+    event.latency_ms = 7
+    return event
+
+
+def _audit_messages(caplog: pytest.LogCaptureFixture) -> list[str]:
+    return [r.getMessage() for r in caplog.records if r.name == "scout_ai.hooks.audit_hook"]
+
+
+class TestImmediateLogging:
+    def test_each_call_logged(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook()
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            hook._on_model_call(_model_event())
+            hook._on_tool_call(_tool_event())
+
+        messages = _audit_messages(caplog)
+        assert messages[0].startswith("llm_call | model=test-model prompt_tokens=10 completion_tokens=5")
+        assert messages[1] == "tool_call | tool=search status=success latency_ms=7"
+
+    def test_skips_extraction_when_info_disabled(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=2)
+        event = _model_event()
+        with caplog.at_level(logging.WARNING, logger="scout_ai.hooks.audit_hook"):
+            hook._on_model_call(event)
+            hook._on_model_call(event)
+
+        assert _audit_messages(caplog) == []
+        assert hook._buffers == {}
+
+
+class TestDisabled:
+    def test_registers_no_callbacks(self) -> None:
+        registry = MagicMock()
+        AuditHook(enabled=False).register_hooks(registry)
+        registry.add_callback.assert_not_called()
+
+
+class TestSettings:
+    def test_batching_configurable_from_env(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from scout_ai.core.config import ObservabilityConfig
+
+        monkeypatch.setenv("SCOUT_OBSERVABILITY_AUDIT_BATCH_SIZE", "50")
+        monkeypatch.setenv("SCOUT_OBSERVABILITY_AUDIT_FLUSH_INTERVAL_SECONDS", "2.5")
+        config = ObservabilityConfig()
+
+        assert config.audit_batch_size == 50
+        assert config.audit_flush_interval_seconds == 2.5
+
+
+class TestBatchedLogging:
+    def test_flushes_when_batch_full(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=2)
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            hook._on_model_call(_model_event())
+            assert _audit_messages(caplog) == []
+            hook._on_tool_call(_tool_event())
+
+        (message,) = _audit_messages(caplog)
+        kind, payload = message.split(" | ", 1)
+        assert kind == "audit_batch"
+        entries = json.loads(payload)
+        assert entries[0]["event"] == "llm_call"
+        assert entries[0]["prompt_tokens"] == 10
+        assert entries[0]["cached_tokens"] == 2
+        assert entries[1] == {"event": "tool_call", "tool": "search", "status": "success", "latency_ms": 7}
+
+    def test_end_run_flushes_partial_batch(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=100)
+        start_run(doc_id="doc")
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            hook._on_tool_call(_tool_event())
+            end_run()
+
+        assert len(_audit_messages(caplog)) == 1
+
+    def test_end_run_leaves_other_runs_buffered(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=100)
+        other = contextvars.copy_context()
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            other.run(start_run, doc_id="other")
+            other.run(hook._on_tool_call, _tool_event())
+
+            start_run(doc_id="doc")
+            hook._on_model_call(_model_event())
+            end_run()
+
+            (message,) = _audit_messages(caplog)
+            assert json.loads(message.split(" | ", 1)[1])[0]["event"] == "llm_call"
+
+            other.run(end_run)
+
+        assert len(_audit_messages(caplog)) == 2
+
+    def test_close_flushes_every_run(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=100)
+        other = contextvars.copy_context()
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            hook._on_tool_call(_tool_event())
+            other.run(start_run, doc_id="doc")
+            other.run(hook._on_tool_call, _tool_event())
+            assert _audit_messages(caplog) == []
+
+            hook.close()
+
+        assert len(_audit_messages(caplog)) == 2
+        assert hook._buffers == {}
+
+    def test_flush_interval_elapsed(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = AuditHook(batch_size=100, flush_interval_seconds=0.0)
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            hook._on_tool_call(_tool_event())
+
+        assert len(_audit_messages(caplog)) == 1
+
+    def test_flush_empty_is_noop(self, caplog: pytest.LogCaptureFixture) -> None:
+        with caplog.at_level(logging.INFO, logger="scout_ai.hooks.audit_hook"):
+            AuditHook(batch_size=10).flush()
+        assert _audit_messages(caplog) == []
@@ -0,0 +1,64 @@
+"""Tests for CircuitBreakerHook state transitions."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from scout_ai.hooks.circuit_breaker_hook import CircuitBreakerHook, CircuitState
+
+
+def _event(error: Exception | None = None) -> MagicMock:
+    event = MagicMock()
+    event.error = error
+    return event
+
+
+class TestTransitions:
+    def test_opens_after_threshold_and_blocks(self) -> None:
+        hook = CircuitBreakerHook(failure_threshold=2, recovery_timeout_seconds=60.0)
+        hook._after_model_call(_event(RuntimeError("boom")))
+        assert hook.state == CircuitState.CLOSED
+        hook._after_model_call(_event(RuntimeError("boom")))
+        assert hook.state == CircuitState.OPEN
+        with pytest.raises(RuntimeError, match="Circuit breaker OPEN"):
+            hook._before_model_call(_event())
+
+    def test_half_open_then_closed_on_success(self) -> None:
+        hook = CircuitBreakerHook(failure_threshold=1, recovery_timeout_seconds=0.0)
+        hook._after_model_call(_event(RuntimeError("boom")))
+        assert hook.state == CircuitState.HALF_OPEN
+        hook._after_model_call(_event())
+        assert hook.state == CircuitState.CLOSED
+
+    def test_reset(self) -> None:
+        hook = CircuitBreakerHook(failure_threshold=1)
+        hook._after_model_call(_event(RuntimeError("boom")))
+        hook.reset()
+        assert hook.state == CircuitState.CLOSED
+
+
+class TestConcurrency:
+    def test_open_transition_logged_once(self, caplog: pytest.LogCaptureFixture) -> None:
+        hook = CircuitBreakerHook(failure_threshold=3, recovery_timeout_seconds=60.0)
+        failure = _event(RuntimeError("boom"))
+        barrier = threading.Barrier(8)
+
+        def fail() -> None:
+            barrier.wait()
+            for _ in range(50):
+                hook._after_model_call(failure)
+
+        with caplog.at_level(logging.WARNING, logger="scout_ai.hooks.circuit_breaker_hook"):
+            threads = [threading.Thread(target=fail) for _ in range(8)]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert hook._failure_count == 400
+        assert hook.state == CircuitState.OPEN
+        assert sum("→ OPEN" in r.getMessage() for r in caplog.records) == 1
@@ -159,6 +159,12 @@ class TestBuildCitationIndex:
         index = SynthesisPipeline._build_citation_index([])
         assert index == {}
 
+    def test_returns_plain_dict(self) -> None:
+        index = SynthesisPipeline._build_citation_index(_make_batch_results())
+        assert type(index) is dict
+        assert index.get(99) is None
+        assert 99 not in index
+
     def test_citation_ref_has_source_info(self) -> None:
         results = _make_batch_results()
         index = SynthesisPipeline._build_citation_index(results)
@@ -228,3 +234,70 @@ class TestCategoryPropagation:
 
         summaries = pipeline._prepare_category_summaries(results)
         assert len(summaries[0]["answers"][0]["citations"]) == 3
+
+
+class TestParseCitationRefs:
+    def test_empty_list(self) -> None:
+        assert SynthesisPipeline._parse_citation_refs([]) == []
+
+    def test_fields_and_defaults(self) -> None:
+        refs = SynthesisPipeline._parse_citation_refs([
+            {"page_number": 3, "date": "01/2024", "verbatim_quote": "BP 140/90"},
+        ])
+        assert len(refs) == 1
+        assert refs[0].page_number == 3
+        assert refs[0].date == "01/2024"
+        assert refs[0].source_type == ""
+        assert refs[0].section_title == ""
+        assert refs[0].verbatim_quote == "BP 140/90"
+
+
+class TestParseAPSSection:
+    def test_sparse_section_defaults_to_empty_lists(self) -> None:
+        section = SynthesisPipeline._parse_aps_section({
+            "section_key": "demographics",
+            "findings": [{"text": "Age 65"}],
+            "lab_results": [],
+        })
+        assert section.section_key == "demographics"
+        assert len(section.findings) == 1
+        assert section.findings[0].severity == "INFORMATIONAL"
+        assert section.lab_results == []
+        assert section.medications == []
+        assert section.medications is not section.allergies
+
+    def test_all_record_types_parsed(self) -> None:
+        cite = [{"page_number": 2}]
+        section = SynthesisPipeline._parse_aps_section({
+            "section_key": "medical_history",
+            "findings": [{"text": "f", "citations": cite}],
+            "conditions": [{"name": "HTN", "citations": cite}],
+            "medications": [{"name": "Lisinopril"}],
+            "lab_results": [{"test_name": "A1c", "value": "7.2"}],
+            "imaging_results": [{"modality": "MRI"}],
+            "encounters": [{"date": "01/2024"}],
+            "vital_signs": [{"name": "BP", "value": "140/90"}],
+            "allergies": [{"allergen": "PCN"}],
+            "surgical_history": [{"procedure": "CABG"}],
+        })
+        assert section.findings[0].citations[0].page_number == 2
+        assert section.conditions[0].citations[0].page_number == 2
+        assert section.medications[0].name == "Lisinopril"
+        assert section.lab_results[0].value == "7.2"
+        assert section.imaging_results[0].modality == "MRI"
+        assert section.encounters[0].date == "01/2024"
+        assert section.vital_signs[0].value == "140/90"
+        assert section.allergies[0].allergen == "PCN"
+        assert section.surgical_history[0].procedure == "CABG"
+
+    def test_severity_labels_are_interned(self) -> None:
+        import sys
+
+        raw = "".join(["CRIT", "ICAL"])  # built at runtime, not a literal
+        section = SynthesisPipeline._parse_aps_section({
+            "section_key": "dx",
+            "findings": [{"text": "f", "severity": raw}],
+            "conditions": [{"name": "c", "severity": None}],
+        })
+        assert section.findings[0].severity is sys.intern("CRITICAL")
+        assert section.conditions[0].severity is None
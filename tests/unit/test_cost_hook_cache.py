@@ -49,6 +49,9 @@ class TestUsageSummary:
         s = UsageSummary(prompt_tokens=1000, cached_tokens=0)
         assert s.estimated_savings_ratio == 0.0
 
+    def test_slotted(self) -> None:
+        assert not hasattr(UsageSummary(), "__dict__")
+
 
 class TestCostHookCacheTracking:
     def setup_method(self) -> None:
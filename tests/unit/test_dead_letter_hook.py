@@ -0,0 +1,59 @@
+"""Tests for DeadLetterHook capture and listing."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from scout_ai.hooks.dead_letter_hook import DeadLetterHook
+from scout_ai.persistence.memory_backend import MemoryPersistenceBackend
+
+
+def _failed_tool(name: str = "search") -> MagicMock:
+    event = MagicMock()
+    event.status = "error"
+    event.tool_name = name
+    event.error = RuntimeError("boom")
+    event.invocation_state = {"pipeline_id": "p1"}
+    return event
+
+
+class TestSynchronousWrites:
+    def test_failure_saved_immediately(self) -> None:
+        backend = MemoryPersistenceBackend()
+        hook = DeadLetterHook(backend)
+        hook._on_tool_done(_failed_tool())
+
+        assert len(backend.list_keys("_dead_letter/p1/search/")) == 1
+        (entry,) = hook.list_dead_letters("p1")
+        assert entry["tool_name"] == "search"
+        assert entry["error"] == "boom"
+
+    def test_success_ignored(self) -> None:
+        backend = MemoryPersistenceBackend()
+        event = _failed_tool()
+        event.status = "success"
+        DeadLetterHook(backend)._on_tool_done(event)
+        assert backend.list_keys() == []
+
+
+class TestIterDeadLetters:
+    def _hook_with_entries(self, n: int) -> tuple[DeadLetterHook, MemoryPersistenceBackend]:
+        backend = MemoryPersistenceBackend()
+        for i in range(n):
+            backend.save(f"_dead_letter/p1/tool{i}/{i}", json.dumps({"tool_name": f"tool{i}"}))
+        return DeadLetterHook(backend), backend
+
+    def test_parallel_loads_preserve_key_order(self) -> None:
+        hook, _ = self._hook_with_entries(20)
+        names = [e["tool_name"] for e in hook.iter_dead_letters("p1", max_workers=4)]
+        assert names == sorted(f"tool{i}" for i in range(20))
+
+    def test_skips_corrupt_entries(self) -> None:
+        hook, backend = self._hook_with_entries(2)
+        backend.save("_dead_letter/p1/bad/0", "{not json")
+        assert len(hook.list_dead_letters("p1")) == 2
+
+    def test_sequential_mode(self) -> None:
+        hook, _ = self._hook_with_entries(3)
+        assert len(list(hook.iter_dead_letters(max_workers=1))) == 3
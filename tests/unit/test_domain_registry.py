@@ -0,0 +1,103 @@
+"""Tests for the convention-based domain registry."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from scout_ai.domains.registry import DomainConfig, DomainRegistry, _import_dotted_path
+
+
+class TestAutoDiscover:
+    def test_discovers_bundled_domains(self) -> None:
+        registry = DomainRegistry()
+        registry.auto_discover()
+        assert registry.has("aps")
+        assert registry.has("workers_comp")
+
+    def test_second_call_is_noop(self) -> None:
+        registry = DomainRegistry()
+        registry.auto_discover()
+        with patch("scout_ai.domains.registry.pkgutil.iter_modules") as iter_modules:
+            registry.auto_discover()
+        iter_modules.assert_not_called()
+
+    def test_force_rescans(self) -> None:
+        registry = DomainRegistry()
+        registry.auto_discover()
+        registry.register(DomainConfig(name="aps", display_name="Overridden"))
+        registry.auto_discover(force=True)
+        assert registry.get("aps").display_name == "Attending Physician Statement"
+
+    def test_broken_domain_package_is_skipped(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import scout_ai.domains as domains_pkg
+
+        broken = tmp_path / "broken_domain"
+        broken.mkdir()
+        (broken / "__init__.py").write_text("import scout_missing_optional_dependency\n")
+        (broken / "__domain__.py").write_text("")
+        monkeypatch.setattr(domains_pkg, "__path__", [*domains_pkg.__path__, str(tmp_path)])
+
+        registry = DomainRegistry()
+        registry.auto_discover()
+
+        assert registry.has("aps")
+        assert not registry.has("broken_domain")
+
+
+class TestListDomains:
+    def test_sorted_and_refreshed_on_register(self) -> None:
+        registry = DomainRegistry()
+        registry.register(DomainConfig(name="b", display_name="B"))
+        registry.register(DomainConfig(name="a", display_name="A"))
+        assert [d.name for d in registry.list_domains()] == ["a", "b"]
+
+        registry.register(DomainConfig(name="c", display_name="C"))
+        assert [d.name for d in registry.list_domains()] == ["a", "b", "c"]
+
+    def test_returned_list_is_a_copy(self) -> None:
+        registry = DomainRegistry()
+        registry.register(DomainConfig(name="a", display_name="A"))
+        registry.list_domains().clear()
+        assert len(registry.list_domains()) == 1
+
+
+class TestResolve:
+    def test_resolves_module_attribute(self) -> None:
+        from scout_ai.domains.aps.validation.engine import RulesEngine
+
+        config = DomainConfig(
+            name="t",
+            display_name="T",
+            validation_engine="scout_ai.domains.aps.validation.engine:RulesEngine",
+        )
+        assert config.resolve("validation_engine") is RulesEngine
+
+    def test_repeat_resolve_skips_import(self) -> None:
+        config = DomainConfig(name="t", display_name="T", prompts_module="scout_ai.prompts.templates.aps")
+        first = config.resolve("prompts_module")
+        with patch("scout_ai.domains.registry._import_dotted_path") as importer:
+            assert config.resolve("prompts_module") is first
+        importer.assert_not_called()
+
+    def test_unconfigured_attr_raises(self) -> None:
+        with pytest.raises(ValueError, match="no 'classifier' configured"):
+            DomainConfig(name="t", display_name="T").resolve("classifier")
+
+
+class TestImportDottedPath:
+    def test_module_attr_form(self) -> None:
+        from scout_ai.domains.registry import get_registry
+
+        assert _import_dotted_path("scout_ai.domains.registry:get_registry") is get_registry
+
+    def test_module_form_imports_submodule(self) -> None:
+        import scout_ai.prompts.templates.aps as aps_templates
+
+        assert _import_dotted_path("scout_ai.prompts.templates.aps") is aps_templates
+
+    def test_missing_attr_raises(self) -> None:
+        with pytest.raises(AttributeError):
+            _import_dotted_path("json:no_such_function")
@@ -0,0 +1,28 @@
+"""Tests for FilePersistenceBackend."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from scout_ai.persistence.file_backend import FilePersistenceBackend
+
+
+class TestFilePersistenceBackend:
+    def test_save_load_roundtrip(self, tmp_path: Path) -> None:
+        backend = FilePersistenceBackend(tmp_path)
+        backend.save("doc/1", '{"a": 1}')
+        backend.save("doc/1", '{"a": 2}')
+
+        assert backend.load("doc/1") == '{"a": 2}'
+        assert [p.name for p in tmp_path.iterdir()] == ["doc_1.json"]
+
+    def test_list_keys_filters_prefix_and_non_json(self, tmp_path: Path) -> None:
+        backend = FilePersistenceBackend(tmp_path)
+        backend.save("idx-b", "{}")
+        backend.save("idx-a", "{}")
+        backend.save("other", "{}")
+        (tmp_path / "notes.txt").write_text("x")
+        (tmp_path / "dir.json").mkdir()
+
+        assert backend.list_keys("idx-") == ["idx-a", "idx-b"]
+        assert backend.list_keys() == ["idx-a", "idx-b", "other"]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -151,6 +152,85 @@ class TestLLMClientCaching:
         assert len(results) == 3
         assert all(r.startswith("answer-") for r in results)
 
+    @pytest.mark.asyncio
+    async def test_complete_batch_iter_yields_in_completion_order(self) -> None:
+        """Faster prompts are yielded first, tagged with their input index."""
+        client = LLMClient(_make_settings())
+        delays = {"slow": 0.05, "fast": 0.0}
+
+        async def _mock_acomp(**kwargs: Any) -> MagicMock:
+            prompt = kwargs["messages"][-1]["content"]
+            await asyncio.sleep(delays[prompt])
+            return _mock_response(prompt)
+
+        with patch("litellm.acompletion", side_effect=_mock_acomp):
+            streamed = [item async for item in client.complete_batch_iter(["slow", "fast"])]
+            ordered = await client.complete_batch(["slow", "fast"])
+
+        assert streamed == [(1, "fast"), (0, "slow")]
+        assert ordered == ["slow", "fast"]
+
+    @pytest.mark.asyncio
+    async def test_complete_batch_coalesces_duplicate_prompts(self) -> None:
+        """Identical prompts in one batch make a single LLM call."""
+        client = LLMClient(_make_settings())
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acomp:
+            mock_acomp.return_value = _mock_response("same")
+            results = await client.complete_batch(["q1", "q2", "q1"])
+
+        assert results == ["same", "same", "same"]
+        assert mock_acomp.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_endpoints_used_round_robin(self) -> None:
+        """Each call is routed to the next configured endpoint shard."""
+        endpoints = [{"api_key": "key-a"}, {"api_key": "key-b"}]
+        client = LLMClient(_make_settings(llm_endpoints=endpoints))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acomp:
+            mock_acomp.return_value = _mock_response("ok")
+            for _ in range(3):
+                await client.complete("prompt")
+
+        keys = [c.kwargs["api_key"] for c in mock_acomp.call_args_list]
+        assert keys == ["key-a", "key-b", "key-a"]
+
+    @pytest.mark.asyncio
+    async def test_max_concurrent_shared_across_batches(self) -> None:
+        """llm_max_concurrent caps in-flight calls across overlapping batches."""
+        client = LLMClient(_make_settings(llm_max_concurrent=2))
+        in_flight = peak = 0
+
+        async def _mock_acomp(**kwargs: Any) -> MagicMock:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return _mock_response("ok")
+
+        with patch("litellm.acompletion", side_effect=_mock_acomp):
+            await asyncio.gather(
+                client.complete_batch(["a", "b", "c"]),
+                client.complete_batch(["d", "e", "f"]),
+                client.complete("g"),
+            )
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_shared_limit_replaces_per_batch_semaphore(self) -> None:
+        """With llm_max_concurrent set, batches do not build their own semaphore."""
+        client = LLMClient(_make_settings(llm_max_concurrent=2))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acomp:
+            mock_acomp.return_value = _mock_response("ok")
+            with patch("asyncio.Semaphore") as per_call_sem:
+                assert await client.complete_batch(["a", "b", "c"], max_concurrent=1) == ["ok", "ok", "ok"]
+
+        per_call_sem.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_finish_reason_mapping(self) -> None:
         """Finish reason 'length' maps to 'max_output_reached'."""
@@ -175,3 +255,29 @@ class TestLLMClientCaching:
             await client.complete("prompt", model="bedrock/anthropic.claude-v2")
 
         assert mock_acomp.call_args.kwargs["model"] == "bedrock/anthropic.claude-v2"
+
+    @pytest.mark.asyncio
+    async def test_prompt_cache_key_forwarded(self) -> None:
+        """prompt_cache_key is passed through only when provided."""
+        client = LLMClient(_make_settings(llm_model="openai/gpt-4o"))
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acomp:
+            mock_acomp.return_value = _mock_response("ok")
+            await client.complete("prompt")
+            assert "prompt_cache_key" not in mock_acomp.call_args.kwargs
+
+            await client.complete("prompt", prompt_cache_key="synthesis-abc")
+            assert mock_acomp.call_args.kwargs["prompt_cache_key"] == "synthesis-abc"
+
+    @pytest.mark.asyncio
+    async def test_prompt_cache_key_dropped_for_unsupported_model(self) -> None:
+        """Non-OpenAI providers never receive prompt_cache_key."""
+        client = LLMClient(_make_settings())
+
+        with patch("litellm.acompletion", new_callable=AsyncMock) as mock_acomp:
+            mock_acomp.return_value = _mock_response("ok")
+            result = await client.complete("prompt", prompt_cache_key="synthesis-abc")
+
+        assert result == "ok"
+        assert mock_acomp.call_args.kwargs["model"] == "anthropic/claude-sonnet-4-20250514"
+        assert "prompt_cache_key" not in mock_acomp.call_args.kwargs
@@ -0,0 +1,73 @@
+"""Tests for structured logging setup."""
+
+from __future__ import annotations
+
+import io
+import logging
+import logging.handlers
+from collections.abc import Iterator
+from unittest.mock import patch
+
+import pytest
+import structlog
+
+from scout_ai.core.config import ObservabilityConfig
+from scout_ai.hooks import logging_config
+from scout_ai.hooks.logging_config import setup_logging
+
+
+@pytest.fixture
+def restore_root_logger() -> Iterator[None]:
+    root = logging.getLogger()
+    scout = logging.getLogger("scout_ai")
+    handlers, level, scout_level = root.handlers[:], root.level, scout.level
+    yield
+    logging_config._stop_queue_listener()
+    root.handlers[:] = handlers
+    root.setLevel(level)
+    scout.setLevel(scout_level)
+    structlog.reset_defaults()
+
+
+@pytest.mark.usefixtures("restore_root_logger")
+class TestQueuedLogging:
+    def test_root_logs_through_background_listener(self) -> None:
+        stream = io.StringIO()
+        with patch.object(logging_config.sys, "stderr", stream):
+            setup_logging(ObservabilityConfig(log_level="INFO"))
+
+        root = logging.getLogger()
+        assert len(root.handlers) == 1
+        assert isinstance(root.handlers[0], logging.handlers.QueueHandler)
+        assert logging_config._queue_listener is not None
+
+        logging.getLogger("scout_ai.test").info("audit %s", "event")
+        logging_config._stop_queue_listener()  # drains the queue
+
+        assert "audit event" in stream.getvalue()
+
+    def test_re_setup_replaces_listener(self) -> None:
+        with patch.object(logging_config.sys, "stderr", io.StringIO()):
+            setup_logging(ObservabilityConfig())
+            first = logging_config._queue_listener
+            setup_logging(ObservabilityConfig())
+
+        assert logging_config._queue_listener is not first
+        assert len(logging.getLogger().handlers) == 1
+
+
+@pytest.mark.usefixtures("restore_root_logger")
+class TestLogProfiles:
+    def test_prod_minimal_drops_logger_name(self) -> None:
+        with patch.object(logging_config.sys, "stderr", io.StringIO()):
+            setup_logging(ObservabilityConfig(log_profile="prod_minimal"))
+
+        processors = structlog.get_config()["processors"]
+        assert structlog.stdlib.add_logger_name not in processors
+        assert not any(isinstance(p, structlog.processors.StackInfoRenderer) for p in processors)
+
+    def test_prod_full_keeps_logger_name(self) -> None:
+        with patch.object(logging_config.sys, "stderr", io.StringIO()):
+            setup_logging(ObservabilityConfig(log_profile="prod_full"))
+
+        assert structlog.stdlib.add_logger_name in structlog.get_config()["processors"]
@@ -82,6 +82,25 @@ class TestHbA1cSeverity:
         issues = check_medical_business(summary, self._rules())
         assert len(issues) == 0
 
+    def test_adequate_severity_only_clears_its_own_section(self) -> None:
+        summary = APSSummary(
+            document_id="test",
+            sections=[
+                APSSection(
+                    section_key="labs",
+                    lab_results=[LabResult(test_name="HbA1c", value="8.2 %")],
+                    findings=[Finding(text="Uncontrolled diabetes", severity="SIGNIFICANT")],
+                ),
+                APSSection(
+                    section_key="followup",
+                    lab_results=[LabResult(test_name="A1C", value="9.0")],
+                    findings=[Finding(text="Recheck", severity="MINOR")],
+                ),
+            ],
+        )
+        issues = check_medical_business(summary, self._rules())
+        assert [i.section_key for i in issues] == ["followup"]
+
 
 class TestBMIRiskFactor:
     def _rules(self) -> list[Rule]:
@@ -122,6 +141,15 @@ class TestBMIRiskFactor:
         issues = check_medical_business(summary, self._rules())
         assert len(issues) == 0
 
+    def test_obese_and_bmi_risk_factors_are_recognized(self) -> None:
+        for risk in ("Morbidly OBESE", "Elevated BMI"):
+            summary = APSSummary(
+                document_id="test",
+                risk_factors=["Diabetes", risk],
+                sections=[APSSection(section_key="vitals", vital_signs=[VitalSign(name="BMI", value="41")])],
+            )
+            assert check_medical_business(summary, self._rules()) == []
+
 
 class TestAutoCriticalConditions:
     def _rules(self) -> list[Rule]:
@@ -238,3 +266,83 @@ class TestControlledSubstances:
         )
         issues = check_medical_business(summary, self._rules())
         assert len(issues) == 0
+
+    def test_counts_across_sections_and_matches_red_flag_case_insensitively(self) -> None:
+        sections = [
+            APSSection(section_key="meds", medications=[Medication(name="Oxycodone 10mg")]),
+            APSSection(section_key="psych", medications=[Medication(name="alprazolam 0.5mg")]),
+        ]
+        flagged = APSSummary(
+            document_id="test",
+            red_flags=[RedFlag(description="Concurrent SUBSTANCE use")],
+            sections=sections,
+        )
+        unflagged = APSSummary(document_id="test", sections=sections)
+        assert check_medical_business(flagged, self._rules()) == []
+        issues = check_medical_business(unflagged, self._rules())
+        assert issues[0].actual_value == "2"
+
+
+class TestPatternCompilation:
+    def test_patterns_compiled_once_per_pattern_list(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _compile_alternation
+
+        first = _compile_alternation(("(?i)\\boxycodone\\b",))
+        second = _compile_alternation(("(?i)\\boxycodone\\b",))
+        assert first is second
+        assert first is not None
+        assert first.search("OxyCodone 5mg")
+
+    def test_fused_alternation_keeps_per_pattern_flags(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _compile_alternation
+
+        combined = _compile_alternation(("(?i)\\bcancer\\b", "\\bHIV\\b"))
+        assert combined is not None
+        assert combined.search("Lung CANCER")
+        assert combined.search("HIV positive")
+        assert not combined.search("hiv positive")
+
+    def test_lowercased_name_sets_cached(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _lower_names
+
+        first = _lower_names(("HbA1c", "A1C"))
+        assert first == frozenset({"hba1c", "a1c"})
+        assert _lower_names(("HbA1c", "A1C")) is first
+
+    def test_empty_pattern_list_matches_nothing(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _compile_alternation
+
+        assert _compile_alternation(()) is None
+
+
+class TestParseNumeric:
+    def test_plain_and_decorated_values(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _parse_numeric
+
+        assert _parse_numeric("7.2") == 7.2
+        assert _parse_numeric(" 32 ") == 32.0
+        assert _parse_numeric("7.2 %") == 7.2
+        assert _parse_numeric("7.2%") == 7.2
+        assert _parse_numeric("BMI 32.1") == 32.1
+        assert _parse_numeric("pending") is None
+        assert _parse_numeric("") is None
+
+    def test_fast_path_matches_regex_semantics(self) -> None:
+        from scout_ai.domains.aps.validation.checks.medical_business import _parse_numeric
+
+        # float() alone would accept these; the regex reading must win
+        assert _parse_numeric(".5") == 5.0
+        assert _parse_numeric("1e3") == 1.0
+        assert _parse_numeric("nan") is None
+        assert _parse_numeric("1.2.3") == 1.2
+
+
+class TestPrebuiltRuleIndex:
+    def test_rules_by_id_used_instead_of_rules_list(self) -> None:
+        rule = _make_rule("MB-002", vital_names=["BMI"], threshold=30.0)
+        summary = APSSummary(
+            document_id="test",
+            sections=[APSSection(section_key="vitals", vital_signs=[VitalSign(name="BMI", value="35.2")])],
+        )
+        issues = check_medical_business(summary, [], rules_by_id={"MB-002": rule})
+        assert [i.rule_id for i in issues] == ["MB-002"]
@@ -205,3 +205,10 @@ class TestEnums:
     def test_extraction_category_values(self):
         assert ExtractionCategory.DEMOGRAPHICS.value == "demographics"
         assert len(ExtractionCategory) == 16
+
+    def test_compat_names_cached_in_module_globals(self):
+        import scout_ai.models as models
+        from scout_ai.domains.aps.models import MedicalSectionType as domain_mst
+
+        assert models.MedicalSectionType is domain_mst
+        assert vars(models)["MedicalSectionType"] is domain_mst
@@ -119,3 +119,20 @@ class TestBackwardCompat:
 
         registry_prompt = get_prompt("aps", "indexing", "GENERATE_TOC_INIT_PROMPT")
         assert GENERATE_TOC_INIT_PROMPT == registry_prompt
+
+    def test_legacy_synthesis_prompt_assembled(self) -> None:
+        from scout_ai.aps.prompts import SYNTHESIS_PROMPT
+
+        rendered = SYNTHESIS_PROMPT.format(category_summaries="[]", document_metadata="{}")
+        static_prefix = get_prompt("aps", "synthesis", "SYNTHESIS_STATIC_PREFIX")
+        assert rendered.startswith(static_prefix)
+        assert rendered.endswith("Document Metadata: {}")
+
+    def test_legacy_structured_synthesis_prompt_import(self) -> None:
+        from scout_ai.aps.prompts import SYNTHESIS_STRUCTURED_PROMPT
+        from scout_ai.prompts.templates.aps.synthesis import (
+            SYNTHESIS_STRUCTURED_PROMPT as TEMPLATE_PROMPT,
+        )
+
+        assert SYNTHESIS_STRUCTURED_PROMPT == TEMPLATE_PROMPT
+        assert "{category_summaries}" in SYNTHESIS_STRUCTURED_PROMPT
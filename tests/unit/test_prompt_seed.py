@@ -0,0 +1,130 @@
+"""Tests for the DynamoDB prompt seed script with a fake boto3 client."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import pytest
+
+pytest.importorskip("boto3")
+
+from scout_ai.prompts import seed  # noqa: E402
+
+
+class FakeBatchClient:
+    """Accepts batch writes, leaving the first ``throttle`` requests unprocessed once."""
+
+    class exceptions:  # noqa: N801 - mirrors boto3's client.exceptions namespace
+        ClientError = RuntimeError
+
+    def __init__(self, throttle: int = 0) -> None:
+        self.calls: list[list[dict[str, Any]]] = []
+        self._throttle = throttle
+
+    def batch_write_item(self, RequestItems: dict[str, list[dict[str, Any]]]) -> dict[str, Any]:  # noqa: N803
+        ((table, requests),) = RequestItems.items()
+        self.calls.append(requests)
+        unprocessed, self._throttle = requests[: self._throttle], 0
+        return {"UnprocessedItems": {table: unprocessed} if unprocessed else {}}
+
+
+def _items(n: int) -> list[dict[str, Any]]:
+    return [seed._build_item("aps", "retrieval", f"P{i}", "text", "ts") for i in range(n)]
+
+
+class TestWriteBatch:
+    def test_single_call_when_all_processed(self) -> None:
+        client = FakeBatchClient()
+        assert seed._write_batch(client, "t", _items(25)) == 25
+        assert len(client.calls) == 1
+
+    def test_retries_unprocessed_items(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(seed.time, "sleep", lambda _s: None)
+        client = FakeBatchClient(throttle=3)
+
+        assert seed._write_batch(client, "t", _items(10)) == 10
+        assert [len(c) for c in client.calls] == [10, 3]
+
+    def test_no_sleep_after_final_attempt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sleeps: list[float] = []
+        monkeypatch.setattr(seed.time, "sleep", sleeps.append)
+        client = FakeBatchClient()
+        monkeypatch.setattr(client, "batch_write_item", lambda **kw: {"UnprocessedItems": kw["RequestItems"]})
+
+        assert seed._write_batch(client, "t", _items(2)) == 0
+        assert len(sleeps) == seed._MAX_BATCH_ATTEMPTS - 1
+
+
+class FakeGetClient(FakeBatchClient):
+    """Returns stored prompt texts for a BatchGetItem, in one round (or fails)."""
+
+    def __init__(self, stored: dict[str, str], fail: bool = False) -> None:
+        super().__init__()
+        self._stored = stored
+        self._fail = fail
+        self.get_calls = 0
+
+    def batch_get_item(self, RequestItems: dict[str, Any]) -> dict[str, Any]:  # noqa: N803
+        ((table, request),) = RequestItems.items()
+        self.get_calls += 1
+        if self._fail:
+            raise self.exceptions.ClientError("AccessDenied")
+        rows = [
+            {"PK": key["PK"], "prompt_text": {"S": self._stored[key["PK"]["S"]]}}
+            for key in request["Keys"]
+            if key["PK"]["S"] in self._stored
+        ]
+        return {"Responses": {table: rows}, "UnprocessedKeys": {}}
+
+
+class TestStoredPromptTexts:
+    def test_chunks_keys_by_100(self) -> None:
+        items = _items(150)
+        client = FakeGetClient({"aps#retrieval#P0": "text", "aps#retrieval#P120": "old"})
+
+        stored = seed._stored_prompt_texts(client, "t", items)
+
+        assert stored == {"aps#retrieval#P0": "text", "aps#retrieval#P120": "old"}
+        assert client.get_calls == 2
+
+    def test_no_sleep_after_final_attempt(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sleeps: list[float] = []
+        monkeypatch.setattr(seed.time, "sleep", sleeps.append)
+        client = FakeGetClient({})
+        monkeypatch.setattr(client, "batch_get_item", lambda **kw: {"UnprocessedKeys": kw["RequestItems"]})
+
+        assert seed._stored_prompt_texts(client, "t", _items(2)) == {}
+        assert len(sleeps) == seed._MAX_BATCH_ATTEMPTS - 1
+
+
+class TestSeedPrompts:
+    @pytest.fixture()
+    def fake_items(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(seed, "_collect_items", lambda _ts: _items(3))
+
+    def _seed(self, monkeypatch: pytest.MonkeyPatch, client: FakeGetClient, **kwargs: Any) -> int:
+        monkeypatch.setattr(seed.boto3, "client", lambda *_a, **_kw: client)
+        return seed.seed_prompts("t", "us-east-1", **kwargs)
+
+    @pytest.mark.usefixtures("fake_items")
+    def test_skips_unchanged_prompts(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = FakeGetClient({"aps#retrieval#P0": "text", "aps#retrieval#P1": "old"})
+
+        assert self._seed(monkeypatch, client) == 3
+        written = [r["PutRequest"]["Item"]["PK"]["S"] for call in client.calls for r in call]
+        assert sorted(written) == ["aps#retrieval#P1", "aps#retrieval#P2"]
+
+    @pytest.mark.usefixtures("fake_items")
+    def test_read_failure_writes_everything(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = FakeGetClient({"aps#retrieval#P0": "text"}, fail=True)
+
+        assert self._seed(monkeypatch, client) == 3
+        assert sum(len(call) for call in client.calls) == 3
+
+    @pytest.mark.usefixtures("fake_items")
+    def test_force_skips_read(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        client = FakeGetClient({"aps#retrieval#P0": "text"})
+
+        assert self._seed(monkeypatch, client, skip_unchanged=False) == 3
+        assert client.get_calls == 0
+        assert sum(len(call) for call in client.calls) == 3
@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from scout_ai.synthesis.models import APSSection, APSSummary, Finding, RiskClassification
+from scout_ai.synthesis.models import APSSection, APSSummary, Finding, RedFlag, RiskClassification
 from scout_ai.validation.checks.risk_classification import check_risk_classification
 from scout_ai.validation.models import IssueSeverity, Rule, RuleCategory, RuleTarget
 
@@ -113,3 +113,44 @@ class TestCriticalVsTier:
         )
         issues = check_risk_classification(summary, self._rules())
         assert len(issues) == 0
+
+    def test_critical_red_flag_with_preferred_plus(self) -> None:
+        summary = APSSummary(
+            document_id="test",
+            risk_classification=RiskClassification(tier="Preferred Plus"),
+            red_flags=[RedFlag(description="Active malignancy", severity="CRITICAL")],
+        )
+        issues = check_risk_classification(summary, self._rules())
+        assert len(issues) == 1
+        assert issues[0].entity_name == "Active malignancy"
+
+    def test_finding_reported_before_red_flag(self) -> None:
+        summary = APSSummary(
+            document_id="test",
+            risk_classification=RiskClassification(tier="Preferred Plus"),
+            sections=[
+                APSSection(
+                    section_key="dx",
+                    findings=[
+                        Finding(text="Stable", severity="MINOR"),
+                        Finding(text="Metastatic cancer", severity="CRITICAL"),
+                    ],
+                )
+            ],
+            red_flags=[RedFlag(description="Active malignancy", severity="CRITICAL")],
+        )
+        issues = check_risk_classification(summary, self._rules())
+        assert len(issues) == 1
+        assert issues[0].entity_name == "Metastatic cancer"
+
+
+class TestLabelSet:
+    def test_cached_interned_frozenset(self) -> None:
+        import sys
+
+        from scout_ai.domains.aps.validation.checks.risk_classification import _label_set
+
+        labels = _label_set(("Preferred Plus", "Standard"))
+        assert labels == frozenset({"Preferred Plus", "Standard"})
+        assert _label_set(("Preferred Plus", "Standard")) is labels
+        assert all(label is sys.intern(label) for label in labels)
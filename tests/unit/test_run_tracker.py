@@ -0,0 +1,47 @@
+"""Tests for the per-run analytics tracker."""
+
+from __future__ import annotations
+
+import time
+
+from scout_ai.hooks.run_tracker import end_run, get_current_run, start_run, track_stage
+
+
+class TestTrackStage:
+    def test_records_stage_with_duration(self) -> None:
+        analytics = start_run(doc_id="doc")
+        with track_stage("retrieval") as stage:
+            time.sleep(0.01)
+            stage.success_count = 3
+        end_run()
+
+        (recorded,) = analytics.stages
+        assert recorded.stage == "retrieval"
+        assert recorded.success_count == 3
+        assert recorded.duration_ms >= 10
+        assert recorded.started_at is not None
+        assert recorded.ended_at is not None
+        assert recorded.ended_at >= recorded.started_at
+
+    def test_noop_without_active_run(self) -> None:
+        assert get_current_run() is None
+        with track_stage("orphan") as stage:
+            pass
+        assert stage.duration_ms >= 0
+        assert get_current_run() is None
+
+
+class TestRunEnd:
+    def test_end_run_without_start_returns_none(self) -> None:
+        assert end_run() is None
+
+    def test_run_and_stage_bound_to_structlog_context(self) -> None:
+        import structlog
+
+        analytics = start_run(doc_id="doc")
+        with track_stage("extraction"):
+            bound = structlog.contextvars.get_contextvars()
+            assert bound["run_id"] == analytics.run_id
+            assert bound["stage"] == "extraction"
+        end_run()
+        assert "run_id" not in structlog.contextvars.get_contextvars()
@@ -16,7 +16,7 @@ from scout_ai.models import (
 )
 from scout_ai.providers.pageindex.client import LLMClient
 from scout_ai.synthesis.models import APSSummary, SynthesisSection, UnderwriterSummary
-from scout_ai.synthesis.pipeline import SynthesisPipeline
+from scout_ai.synthesis.pipeline import SynthesisPipeline, SynthesisResponseCache
 
 
 def _make_settings() -> ScoutSettings:
@@ -433,3 +433,139 @@ class TestStructuredSynthesis:
 
         assert isinstance(summary, UnderwriterSummary)
         assert not isinstance(summary, APSSummary)
+
+
+class TestSynthesisPromptOrdering:
+    @pytest.mark.asyncio
+    async def test_cached_request_puts_static_prefix_in_system_prompt(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client, cache_enabled=True)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+            await pipeline.synthesize_structured(_make_batch_results())
+
+        call = mock_complete.call_args
+        assert "section_key" in call.kwargs["system_prompt"]
+        assert call.kwargs["cache_system"] is True
+        assert call.args[0].startswith("Extraction Results:")
+        assert "section_key" not in call.args[0]
+
+    @pytest.mark.asyncio
+    async def test_uncached_request_orders_static_before_dynamic(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client, cache_enabled=False)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+            await pipeline.synthesize_structured(_make_batch_results())
+
+        prompt_text = mock_complete.call_args.args[0]
+        assert prompt_text.index("section_key") < prompt_text.index("Extraction Results:")
+        assert prompt_text.rstrip().endswith("Document Metadata: {}")
+
+    @pytest.mark.asyncio
+    async def test_prompt_cache_key_stable_across_documents(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client, cache_enabled=True)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+            await pipeline.synthesize_structured(_make_batch_results(), {"doc_id": "a"})
+            first_key = mock_complete.call_args.kwargs["prompt_cache_key"]
+            await pipeline.synthesize_structured([], {"doc_id": "b"})
+            second_key = mock_complete.call_args.kwargs["prompt_cache_key"]
+
+        assert first_key == second_key
+        assert first_key.startswith("synthesis-")
+
+    @pytest.mark.asyncio
+    async def test_category_summaries_serialized_compactly(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client, cache_enabled=True)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+            await pipeline.synthesize_structured(_make_batch_results())
+
+        prompt_text = mock_complete.call_args.args[0]
+        assert '"question_id":"q1"' in prompt_text
+        assert "\n  " not in prompt_text
+
+
+class TestSynthesisResponseCache:
+    def test_lru_eviction(self) -> None:
+        cache = SynthesisResponseCache(max_size=2)
+        cache.put("a", "1")
+        cache.put("b", "2")
+        assert cache.get("a") == "1"  # refresh "a"
+        cache.put("c", "3")
+        assert cache.get("b") is None
+        assert cache.get("a") == "1"
+        assert len(cache) == 2
+
+    def test_ttl_expiry(self) -> None:
+        cache = SynthesisResponseCache(ttl_seconds=0.0)
+        cache.put("a", "1")
+        assert cache.get("a") is None
+
+    @pytest.mark.asyncio
+    async def test_identical_input_skips_llm_call(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client, response_cache=SynthesisResponseCache())
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+            first, _ = await pipeline.synthesize_structured(_make_batch_results(), {"doc_id": "d"})
+            second, _ = await pipeline.synthesize_structured(_make_batch_results(), {"doc_id": "d"})
+            await pipeline.synthesize_structured(_make_batch_results(), {"doc_id": "other"})
+
+        assert mock_complete.call_count == 2
+        assert first is not second
+        assert second.risk_classification.tier == "Standard Plus"
+
+    @pytest.mark.asyncio
+    async def test_shared_cache_keyed_by_model_and_temperature(self) -> None:
+        cache = SynthesisResponseCache()
+        clients = [
+            LLMClient(_make_settings()),
+            LLMClient(_make_settings().model_copy(update={"llm_model": "other-model"})),
+            LLMClient(_make_settings().model_copy(update={"llm_temperature": 0.7})),
+        ]
+
+        for client in clients:
+            with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+                mock_complete.return_value = _MOCK_STRUCTURED_RESPONSE
+                await SynthesisPipeline(client, response_cache=cache).synthesize_structured(
+                    _make_batch_results(), {"doc_id": "d"},
+                )
+            assert mock_complete.call_count == 1
+
+        assert len(cache) == 3
+
+
+class TestSynthesisResponseDecoding:
+    @pytest.mark.asyncio
+    async def test_fenced_structured_response_still_parsed(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = f"Here you go:\n```json\n{_MOCK_STRUCTURED_RESPONSE}\n```"
+            summary, _ = await pipeline.synthesize_structured(_make_batch_results())
+
+        assert summary.demographics.full_name == "John Doe"
+        assert len(summary.sections) == 2
+
+    @pytest.mark.asyncio
+    async def test_non_object_structured_response_falls_back(self) -> None:
+        client = LLMClient(_make_settings())
+        pipeline = SynthesisPipeline(client)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = '["not", "an", "object"]'
+            summary, _ = await pipeline.synthesize_structured(_make_batch_results(), {"doc_id": "bad"})
+
+        assert summary.document_id == "bad"
+        assert summary.sections == []
+        assert summary.total_questions_answered == 4
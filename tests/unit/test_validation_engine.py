@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from unittest.mock import patch
+
 from scout_ai.synthesis.models import (
     APSSection,
     APSSummary,
@@ -184,3 +186,17 @@ class TestRulesEngine:
         report = engine.validate(summary)
         assert report.total_rules_evaluated == 0
         assert report.passed is True
+
+    def test_rule_index_built_once_per_version(self) -> None:
+        backend = MemoryRulesBackend(_make_rules())
+        engine = RulesEngine(backend)
+        summary = APSSummary(document_id="doc")
+
+        with patch.object(backend, "list_rules", wraps=backend.list_rules) as list_rules:
+            engine.validate(summary)
+            engine.validate(summary)
+            assert list_rules.call_count == 1
+
+            backend._version = 2
+            assert engine.validate(summary).rules_version == 2
+            assert list_rules.call_count == 2